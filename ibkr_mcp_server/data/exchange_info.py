@@ -1,13 +1,42 @@
 """Exchange information and trading hours for international markets."""
 
-from typing import Dict, List, Optional, Tuple
-from datetime import time, datetime, timezone
+from collections import defaultdict
+from dataclasses import dataclass
+from random import random
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from datetime import time, datetime, timezone, tzinfo
+import functools
 import pytz
 import logging
+import sys
+import threading
+
+
+@dataclass(frozen=True, slots=True)
+class ExchangeRecord:
+    """Immutable exchange metadata; trading hours keep their datetime.time values."""
+    code: str
+    name: str
+    country: str
+    currency: str
+    timezone: str
+    tz: tzinfo
+    settlement: str
+    trading_hours: Mapping[str, time]
+    trading_hours_text: Dict[str, str]
+    extended_hours: Optional[Mapping[str, time]] = None
+    extended_hours_text: Optional[Dict[str, str]] = None
+    market_maker_hours: Optional[Mapping[str, time]] = None
+    market_maker_hours_text: Optional[Dict[str, str]] = None
+    pre_open: Optional[Mapping[str, time]] = None
+    pre_open_text: Optional[Dict[str, str]] = None
+    has_lunch_break: bool = False
+    continuous_trading: bool = False
 
 
 # Exchange metadata with trading hours and settlement info
-EXCHANGE_INFO = {
+_EXCHANGE_DATA = {
     # European Exchanges
     'XETRA': {
         'name': 'Frankfurt Stock Exchange',
@@ -740,37 +769,109 @@ EXCHANGE_INFO = {
 }
 
 
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only mapping proxies."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+# Read-only view of the exchange table; entries and their session hours can't be mutated
+EXCHANGE_INFO: Mapping[str, Mapping[str, Any]] = _freeze(_EXCHANGE_DATA)
+
+
+@functools.cache
+def _tz(name: str) -> tzinfo:
+    """Resolve a timezone name once; exchanges sharing a zone share the object."""
+    return pytz.timezone(name)
+
+
+def _format_hours(hours: Optional[Mapping[str, time]]) -> Optional[Dict[str, str]]:
+    """Render session times as 'HH:MM' strings for JSON responses."""
+    if hours is None:
+        return None
+    return {key: value.strftime('%H:%M') for key, value in hours.items()}
+
+
+def _build_record(code: str, info: Mapping[str, Any]) -> ExchangeRecord:
+    """Build an ExchangeRecord from an EXCHANGE_INFO entry."""
+    # Interned so comparisons against the small set of repeated values short-circuit on identity
+    return ExchangeRecord(
+        code=sys.intern(code),
+        name=info['name'],
+        country=sys.intern(info['country']),
+        currency=sys.intern(info['currency']),
+        timezone=sys.intern(info['timezone']),
+        tz=_tz(info['timezone']),
+        settlement=sys.intern(info['settlement']),
+        trading_hours=info['trading_hours'],
+        trading_hours_text=_format_hours(info['trading_hours']),
+        extended_hours=info.get('extended_hours'),
+        extended_hours_text=_format_hours(info.get('extended_hours')),
+        market_maker_hours=info.get('market_maker_hours'),
+        market_maker_hours_text=_format_hours(info.get('market_maker_hours')),
+        pre_open=info.get('pre_open'),
+        pre_open_text=_format_hours(info.get('pre_open')),
+        has_lunch_break=info.get('has_lunch_break', False),
+        continuous_trading=info.get('continuous_trading', False)
+    )
+
+
+# Records in EXCHANGE_INFO order, indexed by exchange code once at import
+EXCHANGE_RECORDS: Tuple[ExchangeRecord, ...] = tuple(
+    _build_record(code, info) for code, info in EXCHANGE_INFO.items()
+)
+_BY_CODE: Dict[str, ExchangeRecord] = {record.code: record for record in EXCHANGE_RECORDS}
+
+
+def _build_index(field: str) -> Dict[str, frozenset]:
+    """Group exchange codes by a record field value."""
+    index = defaultdict(set)
+    for record in EXCHANGE_RECORDS:
+        index[getattr(record, field)].add(record.code)
+    return {value: frozenset(codes) for value, codes in index.items()}
+
+
+_BY_CURRENCY: Dict[str, frozenset] = _build_index('currency')
+_BY_COUNTRY: Dict[str, frozenset] = _build_index('country')
+_SUPPORTED_EXCHANGES: Tuple[str, ...] = tuple(_BY_CODE)
+
+# Market status only changes at minute resolution; summaries are reused within this window
+STATUS_CACHE_SECONDS = 30
+
+
 class ExchangeManager:
     """Manages exchange-specific operations and validation."""
     
     def __init__(self):
         self.exchanges = EXCHANGE_INFO
+        self.records = _BY_CODE
         self.logger = logging.getLogger(__name__)
+        self._status_cache = {'bucket': -1, 'computed_at': 0.0, 'value': None}
+        self._status_lock = threading.Lock()
+    
+    def get_record(self, exchange: str) -> Optional[ExchangeRecord]:
+        """Get the immutable exchange record without building a JSON-safe copy."""
+        return self.records.get(exchange.upper())
     
     def get_exchange_info(self, exchange: str) -> Optional[Dict]:
         """Get comprehensive exchange information with JSON-serializable time formats."""
-        info = self.exchanges.get(exchange.upper())
-        if not info:
+        record = self.get_record(exchange)
+        if not record:
             return None
         
-        # Create a copy to avoid modifying the original
-        info_copy = info.copy()
-        
-        # Convert time objects to strings for JSON serialization
-        if 'trading_hours' in info_copy and isinstance(info_copy['trading_hours'], dict):
-            trading_hours = info_copy['trading_hours'].copy()
-            for key, value in trading_hours.items():
-                if hasattr(value, 'strftime'):  # Check if it's a time object
-                    trading_hours[key] = value.strftime('%H:%M')
-            info_copy['trading_hours'] = trading_hours
+        # Shallow dict copy of the read-only entry, so callers get a response they can extend
+        info_copy = self.exchanges[record.code].copy()
         
-        # Also handle market_maker_hours if present
-        if 'market_maker_hours' in info_copy and isinstance(info_copy['market_maker_hours'], dict):
-            mm_hours = info_copy['market_maker_hours'].copy()
-            for key, value in mm_hours.items():
-                if hasattr(value, 'strftime'):  # Check if it's a time object
-                    mm_hours[key] = value.strftime('%H:%M')
-            info_copy['market_maker_hours'] = mm_hours
+        # Time strings are rendered once at import; hand out copies so callers can't alter them
+        info_copy['trading_hours'] = dict(record.trading_hours_text)
+        for key, hours_text in (
+            ('extended_hours', record.extended_hours_text),
+            ('market_maker_hours', record.market_maker_hours_text),
+            ('pre_open', record.pre_open_text),
+        ):
+            if hours_text is not None:
+                info_copy[key] = dict(hours_text)
         
         return info_copy
     
@@ -781,13 +882,13 @@ class ExchangeManager:
     
     def get_timezone(self, exchange: str) -> Optional[str]:
         """Get timezone for an exchange."""
-        info = self.get_exchange_info(exchange)
-        return info.get('timezone') if info else None
+        record = self.get_record(exchange)
+        return record.timezone if record else None
     
     def get_currency(self, exchange: str) -> Optional[str]:
         """Get primary currency for an exchange."""
-        info = self.get_exchange_info(exchange)
-        return info.get('currency') if info else None
+        record = self.get_record(exchange)
+        return record.currency if record else None
     
     def is_market_open(self, exchange: str, current_time: datetime = None) -> bool:
         """Check if market is currently open using pandas-market-calendars."""
@@ -829,39 +930,58 @@ class ExchangeManager:
     
     def get_settlement_info(self, exchange: str) -> Optional[str]:
         """Get settlement period for an exchange."""
-        info = self.get_exchange_info(exchange)
-        return info.get('settlement') if info else None
+        record = self.get_record(exchange)
+        return record.settlement if record else None
     
     def validate_currency_for_exchange(self, exchange: str, currency: str) -> bool:
         """Validate if currency is correct for exchange."""
-        exchange_currency = self.get_currency(exchange)
-        return exchange_currency == currency.upper() if exchange_currency else False
+        return exchange.upper() in _BY_CURRENCY.get(currency.upper(), ())
     
     def get_supported_exchanges(self) -> List[str]:
         """Get list of all supported exchanges."""
-        return list(self.exchanges.keys())
+        return list(_SUPPORTED_EXCHANGES)
+    
+    def get_exchanges_by_country(self, country: str) -> frozenset:
+        """Get codes of all exchanges located in a country."""
+        return _BY_COUNTRY.get(country, frozenset())
     
     def get_market_status_summary(self) -> Dict[str, bool]:
-        """Get market open/closed status for all exchanges."""
+        """Get market open/closed status for all exchanges, cached per 30-second window."""
         current_time = datetime.now(timezone.utc)
-        status = {}
+        now = current_time.timestamp()
+        bucket = int(now // STATUS_CACHE_SECONDS)
+        cache = self._status_cache
         
-        for exchange in self.exchanges.keys():
-            status[exchange] = self.is_market_open(exchange, current_time)
+        # Refresh early with rising probability as the entry ages to avoid a stampede at expiry
+        if cache['bucket'] == bucket:
+            age = now - cache['computed_at']
+            if random() >= (age / STATUS_CACHE_SECONDS) ** 2:
+                return dict(cache['value'])
         
-        return status
+        with self._status_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if cache['bucket'] == bucket and cache['computed_at'] >= now:
+                return dict(cache['value'])
+            
+            status = {}
+            for exchange in _SUPPORTED_EXCHANGES:
+                status[exchange] = self.is_market_open(exchange, current_time)
+            
+            cache.update(bucket=bucket, computed_at=now, value=status)
+        
+        return dict(status)
     
     def get_next_market_open(self, exchange: str) -> Optional[datetime]:
         """Get next market open time for an exchange."""
         # Simplified implementation - could be enhanced with holiday calendars
-        info = self.get_exchange_info(exchange)
-        if not info:
+        record = self.get_record(exchange)
+        if not record:
             return None
         
         # This is a basic implementation
         # Production version would need proper holiday calendar integration
         current_time = datetime.now(timezone.utc)
-        market_tz = pytz.timezone(info['timezone'])
+        market_tz = record.tz
         
         # Convert to market time
         market_time = current_time.astimezone(market_tz)
@@ -874,8 +994,8 @@ class ExchangeManager:
                 days_ahead = 1
             
             next_monday = market_time.replace(
-                hour=info['trading_hours'].get('open', time(9, 0)).hour,
-                minute=info['trading_hours'].get('open', time(9, 0)).minute,
+                hour=record.trading_hours.get('open', time(9, 0)).hour,
+                minute=record.trading_hours.get('open', time(9, 0)).minute,
                 second=0,
                 microsecond=0
             ) + datetime.timedelta(days=days_ahead)
@@ -886,8 +1006,8 @@ class ExchangeManager:
     
     def is_extended_hours_supported(self, exchange: str) -> bool:
         """Check if exchange supports extended hours trading."""
-        info = self.get_exchange_info(exchange)
-        return bool(info and info.get('extended_hours')) if info else False
+        record = self.get_record(exchange)
+        return bool(record.extended_hours) if record else False
 
 
 # Global exchange manager instance
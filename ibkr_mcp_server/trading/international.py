@@ -3,8 +3,14 @@
 import asyncio
 import difflib
 import logging
-from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Tuple
+import sys
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import IntEnum
+from random import random
+from time import monotonic_ns
+from typing import Any, Dict, List, Optional, Tuple
 
 from ib_async import IB, Stock, Index, Contract
 
@@ -13,6 +19,22 @@ from ..utils import safe_float, safe_int, ValidationError
 from ..enhanced_validators import InternationalValidator
 
 
+@dataclass(slots=True)
+class CacheEntry:
+    """Symbol resolution cache entry; reverse lookups hold a {'redirect_to': key} payload."""
+    data: Dict
+    timestamp: float
+    hit_count: int = 0
+    is_reverse_lookup: bool = False
+
+
+class FuzzyDecision(IntEnum):
+    """Outcome of the fuzzy search rate limiting check."""
+    ALLOW = 0
+    RATE_LIMIT = 1
+    DEGRADE = 2
+
+
 class InternationalManager:
     """Manages international market operations with symbol resolution and validation."""
     
@@ -173,9 +195,12 @@ class InternationalManager:
         self.validator = InternationalValidator()
         self.logger = logging.getLogger(__name__)
         
-        # Symbol resolution cache with enhanced monitoring
-        self.resolution_cache = {}
+        # Symbol resolution cache with enhanced monitoring (ordered oldest to most recently used)
+        self.resolution_cache: OrderedDict[Any, CacheEntry] = OrderedDict()
         self.cache_duration = 300  # 5 minutes for symbol resolution
+        self.cache_early_refresh_exponent = 4  # Early refresh chance is (age / duration) ** exponent
+        self._refresh_tasks: Dict[Any, asyncio.Task] = {}  # In-progress background refreshes by cache key
+        self._inflight: Dict[Any, asyncio.Future] = {}  # Resolutions in progress for cache misses by cache key
         
         # PHASE 2 ADDITIONS: Cache statistics
         self.cache_stats = {
@@ -195,10 +220,12 @@ class InternationalManager:
             'req_matching_symbols_calls': 0,
             'total_api_calls': 0,
             'last_api_call': None,
-            'api_calls_per_hour': [],
             'last_hour_calls': 0
         }
         
+        # Sliding one-hour window of API call times (monotonic_ns), oldest first
+        self._api_call_log = deque()
+        
         # PHASE 4.2 ADDITIONS: Fuzzy search accuracy metrics
         self.fuzzy_search_stats = {
             'fuzzy_searches_attempted': 0,
@@ -211,10 +238,9 @@ class InternationalManager:
         
         # PHASE 4.3 ADDITIONS: Rate limiting for fuzzy search
         self.rate_limiting = {
-            'last_fuzzy_search': None,
-            'fuzzy_search_degraded': False,
-            'api_calls_this_hour': 0,
-            'api_rate_limit_start': datetime.now(timezone.utc)
+            'last_fuzzy_search_ns': 0,  # monotonic_ns() of last fuzzy search, 0 = never
+            'interval_ns': 1_000_000_000,  # 1-second minimum between fuzzy searches
+            'fuzzy_search_degraded': False  # Hourly API volume comes from _api_call_log
         }
         
         # Cache configuration
@@ -223,6 +249,9 @@ class InternationalManager:
         
         # Connection state tracking for cache invalidation
         self._last_connection_state = False
+        
+        # Static exchange details, built on first get_supported_exchanges() call
+        self._supported_exchange_details = None
     
     async def get_international_market_data(self, symbols: str, auto_detect: bool = True) -> List[Dict]:
         """Get market data for international stocks with auto-detection and delayed data fallback."""
@@ -602,118 +631,31 @@ class InternationalManager:
         """
         try:
             original_symbol = symbol
-            symbol = symbol.upper().strip()
+            # Interned so hot symbols share one string across cache keys and results
+            symbol = sys.intern(symbol.upper().strip())
             
             # Check connection state changes
             self._check_connection_state_change()
             
             # Enhanced cache key with new parameters including prefer_native_exchange
-            cache_key = f"{symbol}_{exchange}_{currency}_{sec_type}_{max_results}_{prefer_native_exchange}"
+            cache_key = (symbol, exchange, currency, sec_type, max_results, prefer_native_exchange)
             cached_result = self._get_cached_resolution(cache_key)
             if cached_result:
-                cached_result["cache_info"] = {"cache_hit": True, "cache_key": cache_key}
+                if self._should_refresh_early(cache_key):
+                    self._schedule_refresh(cache_key, original_symbol, fuzzy_search, include_alternatives)
+                # Copied so hit metadata never leaks into the cached entry or earlier callers' results
+                result = dict(cached_result)
+                result["cache_info"] = {"cache_hit": True, "cache_key": self._legacy_key(cache_key)}
                 # Add symbol field for backwards compatibility if not present
-                if "symbol" not in cached_result:
-                    cached_result["symbol"] = original_symbol
-                return cached_result
-            
-            # Require IBKR API connection for symbol resolution
-            if not self.ib or not self.ib.isConnected():
-                raise ConnectionError("IBKR API connection required for symbol resolution. Cannot provide stale database data.")
-            
-            # Determine resolution strategy based on input pattern
-            resolution_method = "exact_symbol"
-            matches = []
-            exchange_resolution_info = {}
-            
-            if self._is_exact_symbol(original_symbol):
-                # Direct symbol lookup with exchange fallback
-                matches, exchange_resolution_info = await self._resolve_with_exchange_fallback(symbol, exchange, currency, sec_type)
-                resolution_method = exchange_resolution_info.get('resolution_method', 'exact_symbol')
-                
-            elif self._is_alternative_id(original_symbol):
-                # CUSIP/ISIN/ConID lookup
-                matches = await self._resolve_alternative_id(symbol, exchange, currency, sec_type)
-                resolution_method = "alternative_id"
-                
-            elif fuzzy_search and self._looks_like_company_name(original_symbol):
-                # Fuzzy search for company names
-                matches = await self._resolve_fuzzy_search(original_symbol, exchange, currency, sec_type)
-                resolution_method = "fuzzy_search"
-                
-            elif fuzzy_search:
-                # If fuzzy_search=True is explicitly requested, try fuzzy search even if it doesn't look like a company name
-                # This handles cases like "Apple" that could be company names but don't meet typical patterns
-                try:
-                    matches = await self._resolve_fuzzy_search(original_symbol, exchange, currency, sec_type)
-                    if matches:
-                        resolution_method = "fuzzy_search"
-                    else:
-                        # If fuzzy search fails, fall back to exact symbol with exchange fallback
-                        matches, exchange_resolution_info = await self._resolve_with_exchange_fallback(symbol, exchange, currency, sec_type)
-                        resolution_method = exchange_resolution_info.get('resolution_method', 'exact_symbol')
-                except Exception:
-                    # If fuzzy search fails, fall back to exact symbol with exchange fallback
-                    matches, exchange_resolution_info = await self._resolve_with_exchange_fallback(symbol, exchange, currency, sec_type)
-                    resolution_method = exchange_resolution_info.get('resolution_method', 'exact_symbol')
-                
-            else:
-                # Fall back to exact symbol if fuzzy search disabled, with exchange fallback
-                matches, exchange_resolution_info = await self._resolve_with_exchange_fallback(symbol, exchange, currency, sec_type)
-                resolution_method = exchange_resolution_info.get('resolution_method', 'exact_symbol')
+                result.setdefault("symbol", original_symbol)
+                return result
             
-            # If no matches found and original resolution method failed, update method to 'none'
-            if not matches:
-                resolution_method = "none"
+            # Concurrent misses for the same key share one resolution
+            inflight = self._resolve_single_flight(cache_key, original_symbol, fuzzy_search, include_alternatives)
             
-            # Apply native exchange preference if requested
-            if prefer_native_exchange and matches and not exchange:
-                matches = await self._apply_native_exchange_preference(matches, symbol)
-            
-            # Calculate confidence scores for matches
-            for match in matches:
-                match["confidence"] = self._calculate_confidence_score(match, original_symbol, exchange or "SMART")
-                if include_alternatives:
-                    # Add alternative identifiers if requested
-                    await self._add_alternative_identifiers(match)
-            
-            # Sort by confidence score (highest first)
-            matches.sort(key=lambda x: x.get("confidence", 0), reverse=True)
-            
-            # Limit results to max_results (1-16)
-            max_results = max(1, min(16, max_results))  # Clamp between 1-16
-            matches = matches[:max_results]
-            
-            # Build result
-            result = {
-                "symbol": original_symbol,  # Add symbol field for backwards compatibility
-                "matches": matches,
-                "resolution_method": resolution_method,
-                "query_info": {
-                    "original_query": original_symbol,
-                    "fuzzy_search_used": fuzzy_search and (self._looks_like_company_name(original_symbol) or fuzzy_search),
-                    "total_matches": len(matches)
-                },
-                "cache_info": {
-                    "cache_hit": False,
-                    "cache_key": cache_key
-                },
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
-            
-            # Add exchange information for best match (backwards compatibility)
-            if matches:
-                best_match = matches[0]
-                result["exchange_info"] = {
-                    "exchange": best_match.get('exchange', ''),
-                    "currency": best_match.get('currency', ''),
-                    "validated": True
-                }
-            
-            # Cache the result
-            self._cache_resolution(cache_key, result)
-            
-            return result
+            # Shielded so one caller's cancellation doesn't abort the lookup for the others;
+            # each caller gets its own copy of the shared result
+            return dict(await asyncio.shield(inflight))
             
         except ConnectionError:
             # Re-raise connection errors to maintain clear API requirement
@@ -731,7 +673,7 @@ class InternationalManager:
                 },
                 "cache_info": {
                     "cache_hit": False,
-                    "cache_key": cache_key if 'cache_key' in locals() else f"{symbol}_error"
+                    "cache_key": self._legacy_key(cache_key) if 'cache_key' in locals() else f"{symbol}_error"
                 },
                 "error": str(e),
                 "timestamp": datetime.now(timezone.utc).isoformat()
@@ -739,6 +681,160 @@ class InternationalManager:
     
 
     
+    def _resolve_single_flight(
+        self,
+        cache_key: Tuple,
+        original_symbol: str,
+        fuzzy_search: bool,
+        include_alternatives: bool
+    ) -> asyncio.Future:
+        """Return the resolution in progress for cache_key, starting one if none is running."""
+        inflight = self._inflight.get(cache_key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(
+                self._resolve_and_cache(cache_key, original_symbol, fuzzy_search, include_alternatives)
+            )
+            self._inflight[cache_key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        return inflight
+    
+    async def _resolve_and_cache(
+        self,
+        cache_key: Tuple,
+        original_symbol: str,
+        fuzzy_search: bool,
+        include_alternatives: bool
+    ) -> Dict:
+        """Resolve a symbol against IBKR, bypassing the cache, and store the result under cache_key."""
+        symbol, exchange, currency, sec_type, max_results, prefer_native_exchange = cache_key
+        
+        # Require IBKR API connection for symbol resolution
+        if not self.ib or not self.ib.isConnected():
+            raise ConnectionError("IBKR API connection required for symbol resolution. Cannot provide stale database data.")
+        
+        # Determine resolution strategy based on input pattern
+        resolution_method = "exact_symbol"
+        matches = []
+        exchange_resolution_info = {}
+        
+        if self._is_exact_symbol(original_symbol):
+            # Direct symbol lookup with exchange fallback
+            matches, exchange_resolution_info = await self._resolve_with_exchange_fallback(symbol, exchange, currency, sec_type)
+            resolution_method = exchange_resolution_info.get('resolution_method', 'exact_symbol')
+            
+        elif self._is_alternative_id(original_symbol):
+            # CUSIP/ISIN/ConID lookup
+            matches = await self._resolve_alternative_id(symbol, exchange, currency, sec_type)
+            resolution_method = "alternative_id"
+            
+        elif fuzzy_search and self._looks_like_company_name(original_symbol):
+            # Fuzzy search for company names
+            matches = await self._resolve_fuzzy_search(original_symbol, exchange, currency, sec_type)
+            resolution_method = "fuzzy_search"
+            
+        elif fuzzy_search:
+            # If fuzzy_search=True is explicitly requested, try fuzzy search even if it doesn't look like a company name
+            # This handles cases like "Apple" that could be company names but don't meet typical patterns
+            try:
+                matches = await self._resolve_fuzzy_search(original_symbol, exchange, currency, sec_type)
+                if matches:
+                    resolution_method = "fuzzy_search"
+                else:
+                    # If fuzzy search fails, fall back to exact symbol with exchange fallback
+                    matches, exchange_resolution_info = await self._resolve_with_exchange_fallback(symbol, exchange, currency, sec_type)
+                    resolution_method = exchange_resolution_info.get('resolution_method', 'exact_symbol')
+            except Exception:
+                # If fuzzy search fails, fall back to exact symbol with exchange fallback
+                matches, exchange_resolution_info = await self._resolve_with_exchange_fallback(symbol, exchange, currency, sec_type)
+                resolution_method = exchange_resolution_info.get('resolution_method', 'exact_symbol')
+            
+        else:
+            # Fall back to exact symbol if fuzzy search disabled, with exchange fallback
+            matches, exchange_resolution_info = await self._resolve_with_exchange_fallback(symbol, exchange, currency, sec_type)
+            resolution_method = exchange_resolution_info.get('resolution_method', 'exact_symbol')
+        
+        # If no matches found and original resolution method failed, update method to 'none'
+        if not matches:
+            resolution_method = "none"
+        
+        # Apply native exchange preference if requested
+        if prefer_native_exchange and matches and not exchange:
+            matches = await self._apply_native_exchange_preference(matches, symbol)
+        
+        # Calculate confidence scores for matches
+        for match in matches:
+            match["confidence"] = self._calculate_confidence_score(match, original_symbol, exchange or "SMART")
+            if include_alternatives:
+                # Add alternative identifiers if requested
+                await self._add_alternative_identifiers(match)
+        
+        # Sort by confidence score (highest first)
+        matches.sort(key=lambda x: x.get("confidence", 0), reverse=True)
+        
+        # Limit results to max_results (1-16)
+        max_results = max(1, min(16, max_results))  # Clamp between 1-16
+        matches = matches[:max_results]
+        
+        # Build result
+        result = {
+            "symbol": original_symbol,  # Add symbol field for backwards compatibility
+            "matches": matches,
+            "resolution_method": resolution_method,
+            "query_info": {
+                "original_query": original_symbol,
+                "fuzzy_search_used": fuzzy_search and (self._looks_like_company_name(original_symbol) or fuzzy_search),
+                "total_matches": len(matches)
+            },
+            "cache_info": {
+                "cache_hit": False,
+                "cache_key": self._legacy_key(cache_key)
+            },
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+        
+        # Add exchange information for best match (backwards compatibility)
+        if matches:
+            best_match = matches[0]
+            result["exchange_info"] = {
+                "exchange": best_match.get('exchange', ''),
+                "currency": best_match.get('currency', ''),
+                "validated": True
+            }
+        
+        # Cache the result
+        self._cache_resolution(cache_key, result)
+        
+        return result
+
+    def _should_refresh_early(self, cache_key) -> bool:
+        """Decide whether a cache hit should trigger a background refresh (probabilistic early expiry)."""
+        cache_entry = self.resolution_cache.get(cache_key)
+        if cache_entry is None or cache_key in self._refresh_tasks:
+            return False
+        
+        # Refresh probability climbs steeply as the entry nears expiry, spreading refreshes out
+        age_ratio = (datetime.now(timezone.utc).timestamp() - cache_entry.timestamp) / self.cache_duration
+        return random() < age_ratio ** self.cache_early_refresh_exponent
+    
+    def _schedule_refresh(self, cache_key, original_symbol: str, fuzzy_search: bool, include_alternatives: bool) -> None:
+        """Refresh a cache entry in the background; at most one refresh runs per key."""
+        if cache_key in self._refresh_tasks:
+            return
+        
+        # Registered as in flight right away, so a miss racing the refresh joins it
+        inflight = self._resolve_single_flight(cache_key, original_symbol, fuzzy_search, include_alternatives)
+        
+        async def _refresh():
+            try:
+                await inflight
+            except Exception as e:
+                # The current entry keeps serving until it expires
+                self.logger.debug(f"Background cache refresh failed for {original_symbol}: {e}")
+        
+        task = asyncio.create_task(_refresh())
+        self._refresh_tasks[cache_key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(cache_key, None))
+    
     def _is_exact_symbol(self, input_str: str) -> bool:
         """Detect if input looks like stock symbol."""
         # Allow symbols with dots (e.g., BRK.A, BRK.B) and alphanumeric symbols (e.g., 7203)
@@ -1076,7 +1172,7 @@ class InternationalManager:
                 return []
             
             # Cache check
-            fuzzy_cache_key = f"ibkr_fuzzy_{query.lower().strip()}_{exchange}_{currency}_{sec_type}"
+            fuzzy_cache_key = ("ibkr_fuzzy", query.lower().strip(), exchange, currency, sec_type)
             cached_result = self._get_cached_resolution(fuzzy_cache_key)
             if cached_result:
                 self.logger.debug(f"Returning cached IBKR fuzzy search result for: {query}")
@@ -1428,18 +1524,21 @@ class InternationalManager:
         self.logger.error(f"Contract qualification failed after {max_retries} attempts. Last error: {last_exception}")
         raise last_exception if last_exception else Exception("Contract qualification failed")
     
-    def _cache_resolution(self, cache_key: str, result: Dict) -> None:
+    @staticmethod
+    def _legacy_key(cache_key) -> str:
+        """Render a resolution cache key in the previous underscore-joined string form for reporting."""
+        if isinstance(cache_key, tuple):
+            return '_'.join(map(str, cache_key))
+        return cache_key
+    
+    def _cache_resolution(self, cache_key, result: Dict) -> None:
         """Cache symbol resolution result with statistics tracking and reverse lookups."""
         # PHASE 2: Memory management - cleanup if needed
         if len(self.resolution_cache) >= self.max_cache_size:
             self._cleanup_old_cache_entries()
         
-        # Store main cache entry
-        self.resolution_cache[cache_key] = {
-            'data': result,
-            'timestamp': datetime.now(timezone.utc).timestamp(),
-            'hit_count': 0  # Track popularity for LRU cleanup
-        }
+        # Store main cache entry (hit_count tracks popularity for cleanup)
+        self.resolution_cache[cache_key] = CacheEntry(result, datetime.now(timezone.utc).timestamp())
         
         # NEW: Create reverse lookup entries for company names
         self._create_reverse_lookup_entries(cache_key, result)
@@ -1448,7 +1547,7 @@ class InternationalManager:
         self.cache_stats['memory_usage'] = len(self.resolution_cache)
         self.logger.debug(f"Cached resolution for {cache_key}")
     
-    def _create_reverse_lookup_entries(self, main_cache_key: str, result: Dict) -> None:
+    def _create_reverse_lookup_entries(self, main_cache_key, result: Dict) -> None:
         """Create reverse lookup cache entries mapping company names to symbol resolutions."""
         if 'matches' not in result:
             return
@@ -1467,12 +1566,9 @@ class InternationalManager:
                 reverse_key = f"reverse_lookup_{self._normalize_company_name(company_name)}"
                 
                 # Store redirect to main cache entry (lightweight)
-                self.resolution_cache[reverse_key] = {
-                    'data': {'redirect_to': main_cache_key},
-                    'timestamp': timestamp,
-                    'hit_count': 0,
-                    'is_reverse_lookup': True
-                }
+                self.resolution_cache[reverse_key] = CacheEntry(
+                    {'redirect_to': main_cache_key}, timestamp, is_reverse_lookup=True
+                )
                 
                 self.cache_stats['reverse_lookup_entries'] += 1
                 self.logger.debug(f"Created reverse lookup: {reverse_key} -> {main_cache_key}")
@@ -1519,7 +1615,7 @@ class InternationalManager:
         """Normalize company name for consistent cache key generation."""
         return name.lower().strip().replace(' ', '_').replace('.', '').replace('-', '_')
     
-    def _get_cached_resolution(self, cache_key: str) -> Optional[Dict]:
+    def _get_cached_resolution(self, cache_key) -> Optional[Dict]:
         """Get cached symbol resolution with redirect support for reverse lookups."""
         self.cache_stats['total_requests'] += 1
         
@@ -1529,28 +1625,31 @@ class InternationalManager:
             return None
         
         # Check if cache is still valid
-        if datetime.now(timezone.utc).timestamp() - cache_entry['timestamp'] > self.cache_duration:
+        now = datetime.now(timezone.utc).timestamp()
+        if now - cache_entry.timestamp > self.cache_duration:
             del self.resolution_cache[cache_key]
             self.cache_stats['invalidations'] += 1
             self.cache_stats['misses'] += 1
             return None
         
         # NEW: Handle reverse lookup redirects
-        data = cache_entry['data']
-        if isinstance(data, dict) and 'redirect_to' in data:
+        data = cache_entry.data
+        if cache_entry.is_reverse_lookup:
             # This is a reverse lookup redirect
             redirect_key = data['redirect_to']
             self.logger.debug(f"Following reverse lookup redirect: {cache_key} -> {redirect_key}")
             
             # Get the actual cached data
             actual_entry = self.resolution_cache.get(redirect_key)
-            if actual_entry and datetime.now(timezone.utc).timestamp() - actual_entry['timestamp'] <= self.cache_duration:
-                # Update hit counts for both entries
-                cache_entry['hit_count'] = cache_entry.get('hit_count', 0) + 1
-                actual_entry['hit_count'] = actual_entry.get('hit_count', 0) + 1
+            if actual_entry and now - actual_entry.timestamp <= self.cache_duration:
+                # Update hit counts and recency for both entries
+                cache_entry.hit_count += 1
+                actual_entry.hit_count += 1
+                self.resolution_cache.move_to_end(cache_key)
+                self.resolution_cache.move_to_end(redirect_key)
                 self.cache_stats['hits'] += 1
                 self.cache_stats['reverse_lookup_hits'] += 1
-                return actual_entry['data']
+                return actual_entry.data
             else:
                 # Redirect target is invalid, clean up
                 del self.resolution_cache[cache_key]
@@ -1559,30 +1658,35 @@ class InternationalManager:
                 self.cache_stats['misses'] += 1
                 return None
         
-        # Cache hit - update statistics and popularity
+        # Cache hit - update statistics, popularity and recency
         self.cache_stats['hits'] += 1
-        cache_entry['hit_count'] = cache_entry.get('hit_count', 0) + 1
+        cache_entry.hit_count += 1
+        self.resolution_cache.move_to_end(cache_key)
         
         return data
     
     def get_supported_exchanges(self) -> List[Dict]:
         """Get list of supported international exchanges with details."""
-        exchanges = []
-        
-        for exchange_code in self.exchange_mgr.get_supported_exchanges():
-            info = self.exchange_mgr.get_exchange_info(exchange_code)
-            if info:
-                exchanges.append({
-                    'code': exchange_code,
-                    'name': info['name'],
-                    'country': info['country'],
-                    'currency': info['currency'],
-                    'timezone': info['timezone'],
-                    'settlement': info.get('settlement', ''),
-                    'market_open': self.exchange_mgr.is_market_open(exchange_code)
-                })
-        
-        return exchanges
+        # Static exchange details are built once; only market_open is live
+        if self._supported_exchange_details is None:
+            details = []
+            for exchange_code in self.exchange_mgr.get_supported_exchanges():
+                info = self.exchange_mgr.get_exchange_info(exchange_code)
+                if info:
+                    details.append({
+                        'code': exchange_code,
+                        'name': info['name'],
+                        'country': info['country'],
+                        'currency': info['currency'],
+                        'timezone': info['timezone'],
+                        'settlement': info.get('settlement', '')
+                    })
+            self._supported_exchange_details = tuple(details)
+        
+        return [
+            {**details, 'market_open': self.exchange_mgr.is_market_open(details['code'])}
+            for details in self._supported_exchange_details
+        ]
     
     def get_market_status_summary(self) -> Dict:
         """Get market open/closed status for all supported exchanges."""
@@ -1619,32 +1723,21 @@ class InternationalManager:
         self.logger.info(f"International symbol resolution cache cleared ({cache_size} entries)")
     
     def _update_hourly_api_calls(self) -> None:
-        """Update hourly API call tracking for rate monitoring."""
-        now = datetime.now(timezone.utc)
-        current_hour = now.replace(minute=0, second=0, microsecond=0)
-        
-        # Keep only last 24 hours of data
-        self.api_call_stats['api_calls_per_hour'] = [
-            (hour, count) for hour, count in self.api_call_stats['api_calls_per_hour']
-            if hour >= current_hour - timedelta(hours=24)
-        ]
-        
-        # Update current hour count
-        hour_found = False
-        for i, (hour, count) in enumerate(self.api_call_stats['api_calls_per_hour']):
-            if hour == current_hour:
-                self.api_call_stats['api_calls_per_hour'][i] = (hour, count + 1)
-                hour_found = True
-                break
-        
-        if not hour_found:
-            self.api_call_stats['api_calls_per_hour'].append((current_hour, 1))
-        
-        # Update last hour calls count
-        self.api_call_stats['last_hour_calls'] = sum(
-            count for hour, count in self.api_call_stats['api_calls_per_hour']
-            if hour >= now - timedelta(hours=1)
-        )
+        """Record an API call in the sliding one-hour window for rate monitoring."""
+        now_ns = monotonic_ns()
+        self._api_call_log.append(now_ns)
+        self.api_call_stats['last_hour_calls'] = self._api_calls_in_last_hour(now_ns)
+    
+    def _api_calls_in_last_hour(self, now_ns: int = None) -> int:
+        """Count API calls in the trailing hour, dropping older entries from the window."""
+        if now_ns is None:
+            now_ns = monotonic_ns()
+        
+        window_start = now_ns - 3_600_000_000_000
+        log = self._api_call_log
+        while log and log[0] <= window_start:
+            log.popleft()
+        return len(log)
     
     def _calculate_fuzzy_confidence(self, query: str, matched_company: str, matches: List[Dict]) -> float:
         """Calculate confidence score for fuzzy search match."""
@@ -1729,16 +1822,18 @@ class InternationalManager:
         
         # Find expired entries
         for key, entry in self.resolution_cache.items():
-            if current_time - entry['timestamp'] > self.cache_duration:
+            if current_time - entry.timestamp > self.cache_duration:
                 entries_to_remove.append(key)
         
         # If still over capacity, remove least popular entries
         if len(self.resolution_cache) - len(entries_to_remove) >= self.max_cache_size:
-            # Sort by hit count (ascending) to remove least popular first
+            # Sort by hit count (ascending) to remove least popular first; the sort is
+            # stable over the LRU ordering, so ties evict the least recently used entry.
             # But protect reverse lookup entries whose targets are preserved
+            expired = set(entries_to_remove)
             sorted_entries = sorted(
-                [(k, v) for k, v in self.resolution_cache.items() if k not in entries_to_remove],
-                key=lambda x: x[1].get('hit_count', 0)
+                [(k, v) for k, v in self.resolution_cache.items() if k not in expired],
+                key=lambda x: x[1].hit_count
             )
             
             # Remove oldest entries until under capacity
@@ -1752,17 +1847,13 @@ class InternationalManager:
             # First pass: identify which main entries will be preserved
             for i in range(entries_needed, len(sorted_entries)):
                 key, entry = sorted_entries[i]
-                if not entry.get('is_reverse_lookup', False):
+                if not entry.is_reverse_lookup:
                     preserved_main_keys.add(key)
             
             # Second pass: protect reverse lookups that point to preserved main entries
             for key, entry in self.resolution_cache.items():
-                if (entry.get('is_reverse_lookup', False) and 
-                    isinstance(entry.get('data'), dict) and 
-                    'redirect_to' in entry['data']):
-                    redirect_target = entry['data']['redirect_to']
-                    if redirect_target in preserved_main_keys:
-                        protected_reverse_lookups.add(key)
+                if entry.is_reverse_lookup and entry.data.get('redirect_to') in preserved_main_keys:
+                    protected_reverse_lookups.add(key)
             
             # Select entries for removal, respecting protections
             candidates_removed = 0
@@ -1808,38 +1899,38 @@ class InternationalManager:
     
     def _should_rate_limit_fuzzy_search(self) -> bool:
         """Check if fuzzy search should be rate limited (1-second interval)."""
-        if not self.rate_limiting['last_fuzzy_search']:
+        return self._is_rate_limited(monotonic_ns())
+    
+    def _is_rate_limited(self, now_ns: int) -> bool:
+        """Check the 1-second fuzzy search interval against a monotonic_ns() sample."""
+        last_ns = self.rate_limiting['last_fuzzy_search_ns']
+        if not last_ns:
             return False
         
-        time_since_last = datetime.now(timezone.utc) - self.rate_limiting['last_fuzzy_search']
-        return time_since_last.total_seconds() < 1.0
+        return now_ns - last_ns < self.rate_limiting['interval_ns']
     
     def _update_fuzzy_search_timing(self) -> None:
         """Update the timestamp of the last fuzzy search for rate limiting."""
-        self.rate_limiting['last_fuzzy_search'] = datetime.now(timezone.utc)
+        self.rate_limiting['last_fuzzy_search_ns'] = monotonic_ns()
     
     def _should_degrade_fuzzy_search(self) -> bool:
         """Check if fuzzy search should be degraded due to rate limits."""
+        return self._is_degraded(monotonic_ns())
+    
+    def _is_degraded(self, now_ns: int) -> bool:
+        """Enter or leave degraded mode based on a monotonic_ns() sample; True while degraded."""
         # Check if we're already in degraded mode
         if self.rate_limiting['fuzzy_search_degraded']:
             # Check if we can exit degraded mode (after 1 minute)
-            if self.rate_limiting['last_fuzzy_search']:
-                time_since_last = datetime.now(timezone.utc) - self.rate_limiting['last_fuzzy_search']
-                if time_since_last.total_seconds() > 60:
-                    self.rate_limiting['fuzzy_search_degraded'] = False
-                    self.logger.info("Fuzzy search rate limiting degraded mode disabled")
-                    return False
+            last_ns = self.rate_limiting['last_fuzzy_search_ns']
+            if last_ns and now_ns - last_ns > 60_000_000_000:
+                self.rate_limiting['fuzzy_search_degraded'] = False
+                self.logger.info("Fuzzy search rate limiting degraded mode disabled")
+                return False
             return True
         
-        # Check if we should enter degraded mode based on API call frequency
-        current_time = datetime.now(timezone.utc)
-        hour_start = current_time.replace(minute=0, second=0, microsecond=0)
-        
-        # Count API calls in the current hour
-        api_calls_this_hour = 0
-        for hour_time, count in self.api_call_stats.get('api_calls_per_hour', []):
-            if hour_time >= hour_start:
-                api_calls_this_hour += count
+        # Check if we should enter degraded mode based on API calls in the trailing hour
+        api_calls_this_hour = self._api_calls_in_last_hour(now_ns)
         
         # Enable degraded mode if too many API calls (threshold: 100 per hour)
         if api_calls_this_hour > 100:
@@ -1849,15 +1940,24 @@ class InternationalManager:
         
         return False
     
+    def _fuzzy_decision(self) -> FuzzyDecision:
+        """Decide whether a fuzzy search may run, using a single clock sample for both checks."""
+        now_ns = monotonic_ns()
+        if self._is_rate_limited(now_ns):
+            return FuzzyDecision.RATE_LIMIT
+        if self._is_degraded(now_ns):
+            return FuzzyDecision.DEGRADE
+        return FuzzyDecision.ALLOW
+    
     async def _enforce_rate_limiting(self) -> bool:
         """Enforce rate limiting for fuzzy searches with graceful degradation."""
-        # Check if we should rate limit
-        if self._should_rate_limit_fuzzy_search():
+        decision = self._fuzzy_decision()
+        
+        if decision is FuzzyDecision.RATE_LIMIT:
             self.logger.debug("Fuzzy search rate limited (1-second interval not met)")
             return False
         
-        # Check if we should degrade performance
-        if self._should_degrade_fuzzy_search():
+        if decision is FuzzyDecision.DEGRADE:
             self.logger.debug("Fuzzy search degraded due to high API usage")
             return False
         
@@ -1871,16 +1971,8 @@ class InternationalManager:
         self.api_call_stats['total_api_calls'] += 1
         self.api_call_stats['last_api_call'] = datetime.now(timezone.utc)
         
-        # Track API calls per hour for rate limiting analysis
-        current_hour = datetime.now(timezone.utc).hour
-        if not self.api_call_stats['api_calls_per_hour']:
-            self.api_call_stats['api_calls_per_hour'] = [0] * 24
-        
-        if len(self.api_call_stats['api_calls_per_hour']) <= current_hour:
-            self.api_call_stats['api_calls_per_hour'].extend([0] * (current_hour + 1 - len(self.api_call_stats['api_calls_per_hour'])))
-        
-        self.api_call_stats['api_calls_per_hour'][current_hour] += 1
-        self.api_call_stats['last_hour_calls'] = self.api_call_stats['api_calls_per_hour'][current_hour]
+        # Track API calls in the sliding hour window for rate limiting analysis
+        self._update_hourly_api_calls()
     
     def _track_fuzzy_search_result(self, query: str, matches: List[Dict], success: bool) -> None:
         """Track fuzzy search accuracy metrics."""
@@ -18,8 +18,9 @@ setup(
     extras_require={
         "dev": [
             "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=0.24.0",
             "pytest-mock>=3.10.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "isort>=5.12.0",
             "mypy>=1.0.0",
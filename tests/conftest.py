@@ -3,6 +3,7 @@ Pytest configuration and shared fixtures for IBKR MCP Server testing.
 """
 import pytest
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import Mock, AsyncMock, patch
 from typing import Dict, Any, List
 from datetime import datetime, timezone
@@ -33,6 +34,13 @@ except ImportError:
         pass
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _warmup():
+    """Pay the order-management import and first contract construction before any test is timed"""
+    import ibkr_mcp_server.trading.order_management  # noqa: F401
+    Stock("AAPL", "SMART", "USD")
+
+
 @pytest.fixture
 def mock_settings():
     """Mock enhanced settings for testing"""
@@ -49,7 +57,8 @@ def mock_settings():
 
 @pytest.fixture
 def mock_ib():
-    """Mock IB client with common methods"""
+    """Mock IB client with common methods, reporting a live connection"""
+    # Built fresh per test: nothing a test sets on the mock, its children or the qualified contract leaks
     ib = Mock(spec=IB)
     ib.connectAsync = AsyncMock(return_value=True)
     ib.isConnected = Mock(return_value=True)
@@ -66,6 +75,7 @@ def mock_ib():
     ib.qualifyContractsAsync = AsyncMock(return_value=[mock_contract])
     ib.reqTickersAsync = AsyncMock()
     ib.placeOrder = Mock()
+    ib.cancelOrder = Mock()
     ib.reqOpenOrdersAsync = AsyncMock(return_value=[])
     ib.reqCompletedOrdersAsync = AsyncMock(return_value=[])
     ib.reqExecutionsAsync = AsyncMock(return_value=[])
@@ -73,9 +83,68 @@ def mock_ib():
     ib.accountSummaryAsync = AsyncMock()
     ib.portfolioAsync = AsyncMock()
     ib.accountValuesAsync = AsyncMock()
+    # Order IDs come from the underlying client connection
+    ib.client = Mock()
+    ib.client.getReqId = Mock(return_value=12345)
+    
     return ib
 
 
+@pytest.fixture(scope="module")
+def ib_async_types():
+    """ib_async contract types, resolved once per module"""
+    from ib_async import ContractDescription, Contract
+    
+    return SimpleNamespace(ContractDescription=ContractDescription, Contract=Contract)
+
+
+@pytest.fixture
+def intl_manager_factory(mock_ib):
+    """Factory building InternationalManager instances bound to the test's mock IB"""
+    from ibkr_mcp_server.trading.international import InternationalManager
+
+    # Deliberately not memoized across tests: managers carry resolution cache and
+    # rate-limit state, and construction is cheap next to the mock IB it wraps
+
+    def _make():
+        return InternationalManager(mock_ib)
+    
+    return _make
+
+
+# Validator limits loose enough that order tests never trip them
+_TRADING_ENABLED_SETTINGS = {
+    'enable_trading': True,
+    'enable_forex_trading': True,
+    'enable_international_trading': True,
+    'enable_stop_loss_orders': True,
+    'enable_bracket_orders': True,
+    'ibkr_is_paper': True,
+    'require_paper_account_verification': True,
+    'max_order_size': 1000,
+    'max_order_value_usd': 100000.0,
+    'max_daily_orders': 1000,
+    'max_stop_loss_orders': 100,
+    'max_trail_percent': 25.0,
+    'supported_forex_pairs': ["EURUSD", "GBPUSD", "USDJPY"],
+    'supported_currencies': ["USD", "EUR", "GBP", "JPY", "CHF", "AUD", "CAD"],
+    'allowed_account_prefixes': ["DU", "DUH"],
+}
+
+
+@pytest.fixture(scope="module")
+def enabled_trading_settings():
+    """Enable trading in enhanced_validators for the rest of the requesting module"""
+    # Module rather than session scope: the patch must not leak into modules
+    # that exercise the real (trading-disabled) settings
+    from ibkr_mcp_server import enhanced_validators
+    
+    settings = SimpleNamespace(**_TRADING_ENABLED_SETTINGS)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(enhanced_validators, 'enhanced_settings', settings)
+        yield settings
+
+
 @pytest.fixture
 async def ibkr_client(mock_settings, mock_ib):
     """Create IBKR client with mocked dependencies"""
@@ -329,6 +398,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: Tests that take longer than 30 seconds"
     )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): Keep tests on one pytest-xdist worker under --dist loadgroup"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -8,7 +8,7 @@ import asyncio
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, timezone
 
-from ibkr_mcp_server.trading.international import InternationalManager
+from ibkr_mcp_server.trading.international import InternationalManager, CacheEntry
 
 
 class TestBidirectionalCache:
@@ -124,8 +124,8 @@ class TestBidirectionalCache:
         for reverse_key in reverse_keys:
             assert reverse_key in international_manager.resolution_cache
             cached_entry = international_manager.resolution_cache[reverse_key]
-            assert cached_entry['data']['redirect_to'] == cache_key
-            assert cached_entry.get('is_reverse_lookup') == True
+            assert cached_entry.data['redirect_to'] == cache_key
+            assert cached_entry.is_reverse_lookup is True
     
     def test_get_cached_resolution_with_redirect(self, international_manager):
         """Test that reverse lookup redirects work correctly."""
@@ -146,19 +146,12 @@ class TestBidirectionalCache:
         # Manually create cache entries to test redirect
         timestamp = datetime.now(timezone.utc).timestamp()
         
-        international_manager.resolution_cache[main_cache_key] = {
-            'data': main_result,
-            'timestamp': timestamp,
-            'hit_count': 0
-        }
+        international_manager.resolution_cache[main_cache_key] = CacheEntry(main_result, timestamp)
         
         reverse_key = "reverse_lookup_tesla"
-        international_manager.resolution_cache[reverse_key] = {
-            'data': {'redirect_to': main_cache_key},
-            'timestamp': timestamp,
-            'hit_count': 0,
-            'is_reverse_lookup': True
-        }
+        international_manager.resolution_cache[reverse_key] = CacheEntry(
+            {'redirect_to': main_cache_key}, timestamp, is_reverse_lookup=True
+        )
         
         # Test reverse lookup redirect
         result = international_manager._get_cached_resolution(reverse_key)
@@ -167,8 +160,8 @@ class TestBidirectionalCache:
         assert result['matches'][0]['symbol'] == 'TSLA'
         
         # Check hit counts were updated
-        assert international_manager.resolution_cache[reverse_key]['hit_count'] == 1
-        assert international_manager.resolution_cache[main_cache_key]['hit_count'] == 1
+        assert international_manager.resolution_cache[reverse_key].hit_count == 1
+        assert international_manager.resolution_cache[main_cache_key].hit_count == 1
     
     def test_check_reverse_lookup_cache(self, international_manager):
         """Test reverse lookup cache checking functionality."""
@@ -187,18 +180,11 @@ class TestBidirectionalCache:
         main_cache_key = "MSFT_NASDAQ_USD_STK_5_False"
         timestamp = datetime.now(timezone.utc).timestamp()
         
-        international_manager.resolution_cache[main_cache_key] = {
-            'data': main_result,
-            'timestamp': timestamp,
-            'hit_count': 0
-        }
+        international_manager.resolution_cache[main_cache_key] = CacheEntry(main_result, timestamp)
         
-        international_manager.resolution_cache["reverse_lookup_microsoft"] = {
-            'data': {'redirect_to': main_cache_key},
-            'timestamp': timestamp,
-            'hit_count': 0,
-            'is_reverse_lookup': True
-        }
+        international_manager.resolution_cache["reverse_lookup_microsoft"] = CacheEntry(
+            {'redirect_to': main_cache_key}, timestamp, is_reverse_lookup=True
+        )
         
         # Test exact match
         result = international_manager._check_reverse_lookup_cache("Microsoft")
@@ -234,18 +220,11 @@ class TestBidirectionalCache:
         main_cache_key = "ASML_AEB_EUR_STK_5_False"
         timestamp = datetime.now(timezone.utc).timestamp()
         
-        international_manager.resolution_cache[main_cache_key] = {
-            'data': main_result,
-            'timestamp': timestamp,
-            'hit_count': 0
-        }
+        international_manager.resolution_cache[main_cache_key] = CacheEntry(main_result, timestamp)
         
-        international_manager.resolution_cache["reverse_lookup_asml"] = {
-            'data': {'redirect_to': main_cache_key},
-            'timestamp': timestamp,
-            'hit_count': 0,
-            'is_reverse_lookup': True
-        }
+        international_manager.resolution_cache["reverse_lookup_asml"] = CacheEntry(
+            {'redirect_to': main_cache_key}, timestamp, is_reverse_lookup=True
+        )
         
         # Mock rate limiting to pass
         with patch.object(international_manager, '_enforce_rate_limiting', return_value=True):
@@ -266,28 +245,21 @@ class TestBidirectionalCache:
         
         # Main entry with high hit count (should be preserved)
         main_key = "AAPL_NASDAQ_USD_STK_5_False"
-        international_manager.resolution_cache[main_key] = {
-            'data': {'matches': [{'symbol': 'AAPL'}]},
-            'timestamp': timestamp,
-            'hit_count': 100
-        }
+        international_manager.resolution_cache[main_key] = CacheEntry(
+            {'matches': [{'symbol': 'AAPL'}]}, timestamp, hit_count=100
+        )
         
         # Reverse lookup pointing to main entry
         reverse_key = "reverse_lookup_apple"
-        international_manager.resolution_cache[reverse_key] = {
-            'data': {'redirect_to': main_key},
-            'timestamp': timestamp,
-            'hit_count': 50,
-            'is_reverse_lookup': True
-        }
+        international_manager.resolution_cache[reverse_key] = CacheEntry(
+            {'redirect_to': main_key}, timestamp, hit_count=50, is_reverse_lookup=True
+        )
         
-        # Low hit count entry (should be removed)
+        # Low hit count entry with old timestamp (should be removed)
         old_key = "OLD_SYMBOL_KEY"
-        international_manager.resolution_cache[old_key] = {
-            'data': {'matches': [{'symbol': 'OLD'}]},
-            'timestamp': timestamp - 1000,  # Old timestamp
-            'hit_count': 1
-        }
+        international_manager.resolution_cache[old_key] = CacheEntry(
+            {'matches': [{'symbol': 'OLD'}]}, timestamp - 1000, hit_count=1
+        )
         
         # Fill cache to trigger cleanup
         international_manager.max_cache_size = 2
@@ -301,6 +273,19 @@ class TestBidirectionalCache:
         # Old entry should be removed
         assert old_key not in international_manager.resolution_cache
 
+    
+    def test_cache_hit_refreshes_recency(self, international_manager):
+        """Test that cache hits move entries to the most recently used end."""
+        aapl_key = ("AAPL", None, None, "STK", 5, False)
+        msft_key = ("MSFT", None, None, "STK", 5, False)
+        international_manager._cache_resolution(aapl_key, {'matches': []})
+        international_manager._cache_resolution(msft_key, {'matches': []})
+        
+        assert international_manager._get_cached_resolution(aapl_key) is not None
+        
+        assert list(international_manager.resolution_cache)[-1] == aapl_key
+        assert international_manager.resolution_cache[aapl_key].hit_count == 1
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
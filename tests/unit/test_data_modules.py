@@ -5,6 +5,7 @@ This module tests the static reference data used throughout the IBKR MCP Server.
 """
 
 import pytest
+from collections.abc import Mapping
 from typing import Dict, List, Set
 
 from ibkr_mcp_server.data import (
@@ -33,7 +34,7 @@ class TestReferenceDataLoading:
         
         # Test exchange info data
         assert EXCHANGE_INFO is not None
-        assert isinstance(EXCHANGE_INFO, dict)
+        assert isinstance(EXCHANGE_INFO, Mapping)
         assert len(EXCHANGE_INFO) > 0
         
         # Test manager objects are properly initialized
@@ -186,7 +187,7 @@ class TestReferenceDataLoading:
         # Test trading hours format (should be time objects)
         for exchange, data in EXCHANGE_INFO.items():
             trading_hours = data['trading_hours']
-            assert isinstance(trading_hours, dict), f"Exchange {exchange} trading_hours should be dict"
+            assert isinstance(trading_hours, Mapping), f"Exchange {exchange} trading_hours should be a mapping"
             
             # Check if exchange has lunch break (different format)
             has_lunch_break = data.get('has_lunch_break', False)
@@ -213,6 +214,41 @@ class TestReferenceDataLoading:
                 assert hasattr(open_time, 'hour'), f"Exchange {exchange} open time should be time object"
                 assert hasattr(close_time, 'hour'), f"Exchange {exchange} close time should be time object"
     
+    def test_exchange_records_index(self):
+        """Test exchange records mirror EXCHANGE_INFO and are immutable"""
+        from dataclasses import FrozenInstanceError
+        from ibkr_mcp_server.data.exchange_info import EXCHANGE_RECORDS
+        
+        assert [record.code for record in EXCHANGE_RECORDS] == list(EXCHANGE_INFO)
+        
+        for record in EXCHANGE_RECORDS:
+            data = EXCHANGE_INFO[record.code]
+            assert exchange_manager.get_record(record.code.lower()) is record
+            assert record.currency == data['currency']
+            assert record.country == data['country']
+            assert record.has_lunch_break == data.get('has_lunch_break', False)
+            assert record.tz.zone == data['timezone']
+        
+        # Exchanges in the same zone share one resolved timezone object
+        assert exchange_manager.get_record('SSE').tz is exchange_manager.get_record('SZSE').tz
+        
+        with pytest.raises(FrozenInstanceError):
+            exchange_manager.get_record('TSE').currency = 'USD'
+        
+        assert exchange_manager.get_record('UNKNOWN') is None
+        
+        # The exchange table is read-only all the way down
+        with pytest.raises(TypeError):
+            EXCHANGE_INFO['NYSE']['country'] = 'X'
+        with pytest.raises(TypeError):
+            EXCHANGE_INFO['NYSE']['trading_hours']['open'] = None
+        
+        # JSON-safe hours are rendered once per record; returned dicts are copies
+        smart_info = exchange_manager.get_exchange_info('SMART')
+        assert smart_info['trading_hours'] == {'open': '09:30', 'close': '16:00'}
+        smart_info['trading_hours']['open'] = '00:00'
+        assert exchange_manager.get_exchange_info('SMART')['trading_hours']['open'] == '09:30'
+    
     def test_data_validation(self):
         """Test data integrity validation"""
         # Test forex pairs data integrity
@@ -283,7 +319,7 @@ class TestReferenceDataLoading:
             
             # Test trading hours exist
             trading_hours = data['trading_hours']
-            assert isinstance(trading_hours, dict), f"Exchange {exchange} trading_hours should be dict"
+            assert isinstance(trading_hours, Mapping), f"Exchange {exchange} trading_hours should be a mapping"
             assert len(trading_hours) > 0, f"Exchange {exchange} trading_hours should not be empty"
         
         # Test cross-reference integrity for remaining static data
@@ -4,54 +4,200 @@ Unit tests for IBKR MCP Server International Manager.
 Tests the international trading functionality including symbol resolution,
 market data processing, and global exchange support.
 """
-import pytest
 import asyncio
-import time
-from unittest.mock import Mock, AsyncMock, patch
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, AsyncMock
 from datetime import datetime, timezone, timedelta
 
-from ibkr_mcp_server.trading.international import InternationalManager
+# Skip the whole module cheaply when ib_async is unavailable
+ib_async = pytest.importorskip("ib_async")
+
+from ibkr_mcp_server.trading.international import InternationalManager, CacheEntry, FuzzyDecision
 from ibkr_mcp_server.utils import ValidationError
 
+# Major international exchanges every build must support
+_EXPECTED_EXCHANGES = frozenset({"AEB", "XETRA", "TSE"})  # Amsterdam, Frankfurt, Tokyo
+
+
+@pytest.fixture(scope="module")
+def make_intl_ticker():
+    """Factory for international tickers with a plain-attribute contract"""
+    def _make(symbol, exchange, currency, last, bid, ask):
+        ticker = Mock()
+        ticker.contract = SimpleNamespace(
+            symbol=symbol, exchange=exchange, currency=currency, conId=None
+        )
+        ticker.last = last
+        ticker.bid = bid
+        ticker.ask = ask
+        return ticker
+    
+    return _make
+
+
+@pytest.fixture
+def connected_ib(mock_ib):
+    """Mock IB reporting an active connection (conftest builds it with isConnected() -> True per test)"""
+    return mock_ib
+
+
+@pytest.fixture
+def connected_empty_ib(connected_ib):
+    """Connected mock IB whose contract lookups and tickers come back empty"""
+    connected_ib.qualifyContractsAsync.return_value = []
+    connected_ib.reqContractDetailsAsync.return_value = []
+    connected_ib.reqTickersAsync.return_value = []
+    return connected_ib
+
+
+def _async_return(value):
+    """Plain coroutine stub returning value; cheaper than AsyncMock when no call asserts are needed"""
+    async def _stub(*args, **kwargs):
+        return value
+    
+    return _stub
+
+
+async def _fallback_db_fallback(intl_manager, ib):
+    # When database has no match, should fallback to guessing
+    result = await intl_manager.resolve_symbol("UNKNOWN_SYMBOL")
+    assert result['symbol'] == "UNKNOWN_SYMBOL"
+    assert 'matches' in result
+    assert 'resolution_method' in result
+    # Should either have database matches or fallback method
+    assert result['resolution_method'] in ['database', 'guessed', 'none', 'error']
+
+
+async def _fallback_error_empty(intl_manager, ib):
+    # When everything fails, should return error structure gracefully
+    result_error = await intl_manager.resolve_symbol("")  # Empty symbol
+    assert result_error['symbol'] == ""
+    assert 'matches' in result_error
+    assert isinstance(result_error.get('matches'), list)
+
+
+async def _fallback_market_data_fallback(intl_manager, ib):
+    # Market data fallback when contracts fail
+    try:
+        market_data = await intl_manager.get_international_market_data(["UNKNOWN_SYM"])
+        # Should handle gracefully and return empty or error
+        assert isinstance(market_data, (list, dict))
+    except Exception as e:
+        # Should provide meaningful error messages
+        assert isinstance(e, (ValueError, ConnectionError)) or "qualify" in str(e).lower()
+
+
+async def _fallback_smart_routing(intl_manager, ib):
+    # Successful fallback to SMART routing
+    fallback_contract = Mock()
+    fallback_contract.symbol = "AAPL"
+    fallback_contract.exchange = "SMART"
+    fallback_contract.currency = "USD"
+    fallback_contract.conId = 265598
+    
+    mock_ticker = Mock()
+    mock_ticker.contract = fallback_contract
+    mock_ticker.last = 180.50
+    mock_ticker.bid = 180.48
+    mock_ticker.ask = 180.52
+    
+    ib.qualifyContractsAsync.return_value = [fallback_contract]
+    ib.reqTickersAsync.return_value = [mock_ticker]
+    
+    # Test successful market data with fallback routing
+    try:
+        market_data = await intl_manager.get_international_market_data(["AAPL"])
+        if market_data and len(market_data) > 0:
+            assert market_data[0]['symbol'] == "AAPL"
+            assert 'last' in market_data[0]
+    except Exception:
+        # Fallback test - should not fail catastrophically
+        assert True  # Test passes if no major exception
+
+
+# Fallback scenarios run against a connected IB whose lookups come back empty
+_FALLBACK_SCENARIOS = {
+    "db_fallback": _fallback_db_fallback,
+    "error_empty": _fallback_error_empty,
+    "market_data_fallback": _fallback_market_data_fallback,
+    "smart_routing": _fallback_smart_routing,
+}
+
+
+@pytest.fixture(scope="module")
+def async_stub():
+    """Build coroutine stubs that return a fixed value"""
+    return _async_return
+
+
+@pytest.fixture
+def stubbed_manager(intl_manager_factory, connected_ib, async_stub):
+    """Factory for connected managers with stubbed exact and fuzzy resolvers"""
+    def _make(exact=None, fuzzy=None):
+        intl_manager = intl_manager_factory()
+        intl_manager._resolve_exact_symbol = async_stub(exact or [])
+        intl_manager._resolve_fuzzy_search = async_stub(fuzzy or [])
+        return intl_manager
+    
+    return _make
+
+
+@pytest.fixture
+def frozen_time(monkeypatch):
+    """Freeze the international module's wall and monotonic clocks; returns advance(seconds)"""
+    import ibkr_mcp_server.trading.international as intl_module
+    
+    current = [datetime(2024, 1, 1, tzinfo=timezone.utc)]
+    current_ns = [3_600_000_000_000]  # monotonic clocks start at an arbitrary point
+    
+    class _FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return current[0].astimezone(tz) if tz else current[0].replace(tzinfo=None)
+    
+    monkeypatch.setattr(intl_module, "datetime", _FrozenDatetime)
+    monkeypatch.setattr(intl_module, "monotonic_ns", lambda: current_ns[0])
+    
+    def advance(seconds):
+        current[0] += timedelta(seconds=seconds)
+        current_ns[0] += int(seconds * 1_000_000_000)
+    
+    return advance
+
 
 @pytest.mark.unit
+@pytest.mark.xdist_group(name="international_manager")
 class TestInternationalManager:
     """Test international trading functionality"""
     
-    def test_international_manager_initialization(self, mock_ib):
+    def test_international_manager_initialization(self, intl_manager_factory, mock_ib):
         """Test international manager initializes correctly"""
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         assert intl_manager.ib == mock_ib
-        assert hasattr(intl_manager, 'exchange_mgr')  # Now uses exchange manager only
-        assert hasattr(intl_manager, 'validator')
         
-        # Test methods exist
-        assert hasattr(intl_manager, 'get_international_market_data')
-        assert hasattr(intl_manager, 'resolve_symbol')
+        # Components (now exchange manager only) and public methods exist
+        expected = {'exchange_mgr', 'validator', 'get_international_market_data', 'resolve_symbol'}
+        attrs = set(dir(intl_manager))
+        assert expected <= attrs, expected - attrs
     
-    @pytest.mark.asyncio
-    async def test_resolve_symbol_success(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_resolve_symbol_success(self, intl_manager_factory, connected_ib):
         """Test successful symbol resolution with direct IBKR API"""
         # Setup mock for direct IBKR API call (reqContractDetailsAsync)
-        mock_contract_detail = Mock()
-        mock_contract = Mock()
-        mock_contract.symbol = "ASML"
-        mock_contract.exchange = "AEB" 
-        mock_contract.currency = "EUR"
-        mock_contract.conId = 117589399
-        mock_contract.longName = "ASML Holding NV"
-        mock_contract.primaryExchange = "AEB"
+        mock_contract = SimpleNamespace(
+            symbol="ASML", exchange="AEB", currency="EUR", conId=117589399,
+            longName="ASML Holding NV", primaryExchange="AEB"
+        )
+        mock_contract_detail = SimpleNamespace(
+            contract=mock_contract,
+            secIdList=[SimpleNamespace(tag="ISIN", value="NL0010273215")]
+        )
         
-        mock_contract_detail.contract = mock_contract
-        mock_contract_detail.secIdList = [
-            Mock(tag="ISIN", value="NL0010273215")
-        ]
+        connected_ib.reqContractDetailsAsync = AsyncMock(return_value=[mock_contract_detail])
         
-        mock_ib.isConnected.return_value = True
-        mock_ib.reqContractDetailsAsync = AsyncMock(return_value=[mock_contract_detail])
-        
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         # Test ASML resolution - now uses direct IBKR API
         result = await intl_manager.resolve_symbol("ASML")
@@ -64,21 +210,17 @@ class TestInternationalManager:
         
         # Check first match has the expected fields from real IBKR data
         first_match = result['matches'][0]
-        assert first_match['symbol'] == 'ASML'
-        assert first_match['conid'] == 117589399
-        assert first_match['name'] == 'ASML Holding NV'
-        assert first_match['exchange'] == 'AEB'
-        assert first_match['currency'] == 'EUR'
+        expected = {
+            'symbol': 'ASML', 'conid': 117589399, 'name': 'ASML Holding NV',
+            'exchange': 'AEB', 'currency': 'EUR'
+        }
+        assert {k: first_match.get(k) for k in expected} == expected
         assert 'isin' in first_match
     
-    @pytest.mark.asyncio
-    async def test_resolve_symbol_not_found(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_resolve_symbol_not_found(self, intl_manager_factory, connected_empty_ib):
         """Test symbol resolution for unknown symbol with direct IBKR API"""
-        # Setup mock for direct IBKR API - no matches found
-        mock_ib.isConnected.return_value = True
-        mock_ib.reqContractDetailsAsync = AsyncMock(return_value=[])  # No contract details found
-        
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         # Test unknown symbol - now uses direct IBKR API
         result = await intl_manager.resolve_symbol("UNKNOWN")
@@ -92,22 +234,11 @@ class TestInternationalManager:
         # New implementation returns 'none' when no matches found
         assert result['resolution_method'] == 'none'
 
-    @pytest.mark.asyncio
-    async def test_resolve_symbol_fuzzy_search(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_resolve_symbol_fuzzy_search(self, stubbed_manager):
         """Test fuzzy search functionality for company names"""
-        # Setup mock for fuzzy search
-        mock_ib.isConnected.return_value = True
-        
-        intl_manager = InternationalManager(mock_ib)
-        
-        # Mock the internal resolution methods to simulate fuzzy search behavior
-        # First, _resolve_exact_symbol("APPLE") should fail (no such symbol)
-        # Then, _resolve_fuzzy_search("Apple") should succeed and return AAPL
-        
-        # Mock _resolve_exact_symbol to return empty for "APPLE" (not a real symbol)
-        intl_manager._resolve_exact_symbol = AsyncMock(return_value=[])
-        
-        # Mock _resolve_fuzzy_search to return AAPL match for "Apple"
+        # _resolve_exact_symbol("APPLE") fails (no such symbol), then
+        # _resolve_fuzzy_search("Apple") succeeds and returns AAPL
         mock_aapl_match = {
             'symbol': 'AAPL',
             'name': 'Apple Inc.',
@@ -116,7 +247,7 @@ class TestInternationalManager:
             'sec_type': 'STK',
             'country': 'United States'
         }
-        intl_manager._resolve_fuzzy_search = AsyncMock(return_value=[mock_aapl_match])
+        intl_manager = stubbed_manager(fuzzy=[mock_aapl_match])
         
         # Test company name fuzzy search
         result = await intl_manager.resolve_symbol("Apple", fuzzy_search=True)
@@ -135,63 +266,34 @@ class TestInternationalManager:
             # Should find AAPL for Apple
             assert first_match['symbol'] == 'AAPL'
 
-    @pytest.mark.asyncio
-    async def test_ibkr_native_fuzzy_search_integration(self, mock_ib):
-        """Test IBKR native reqMatchingSymbolsAsync API integration for European companies"""
-        # Setup mock for IBKR native API
-        mock_ib.isConnected.return_value = True
-        
-        # Mock the IBKR reqMatchingSymbolsAsync API response for European company
-        from ib_async import ContractDescription, Contract
-        
-        # Create a mock contract for European company (e.g., Kongsberg)
-        mock_contract = Contract()
-        mock_contract.symbol = "KOG"
-        mock_contract.exchange = "OSE"
-        mock_contract.currency = "NOK"
-        mock_contract.secType = "STK"
-        mock_contract.conId = 123456
-        mock_contract.country = "Norway"
-        mock_contract.primaryExchange = "OSE"
-        
-        mock_contract_desc = Mock()
-        mock_contract_desc.contract = mock_contract
-        mock_contract_desc.description = "Kongsberg Group ASA"
-        
-        # Mock the IBKR API call
-        mock_ib.reqMatchingSymbolsAsync = AsyncMock(return_value=[mock_contract_desc])
-        
-        intl_manager = InternationalManager(mock_ib)
-        
-        # Test European company name fuzzy search
-        result = await intl_manager._resolve_fuzzy_search("Kongsberg")
-        
-        assert isinstance(result, list)
-        assert len(result) > 0
-        
-        # Verify the IBKR API was called
-        mock_ib.reqMatchingSymbolsAsync.assert_called_once_with("Kongsberg")
-        
-        # Check the result structure
-        first_match = result[0]
-        assert first_match['symbol'] == 'KOG'
-        assert first_match['name'] == 'Kongsberg Group ASA'
-        assert first_match['exchange'] == 'OSE'
-        assert first_match['currency'] == 'NOK'
-        assert first_match['country'] == 'Norway'
-        assert first_match['confidence'] == 0.9  # High confidence for IBKR matches
-        assert 'conid' in first_match
-        assert first_match['conid'] == 123456
-
-    @pytest.mark.asyncio
-    async def test_ibkr_fuzzy_search_fallback_behavior(self, mock_ib):
-        """Test fallback behavior when IBKR fuzzy search fails"""
-        mock_ib.isConnected.return_value = True
-        
-        # Mock IBKR API to raise an exception
-        mock_ib.reqMatchingSymbolsAsync = AsyncMock(side_effect=Exception("IBKR API error"))
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("ibkr_behavior", ["success", "exception"])
+    async def test_ibkr_native_fuzzy_search(self, intl_manager_factory, connected_ib, ib_async_types,
+                                            ibkr_behavior):
+        """Test IBKR native reqMatchingSymbolsAsync integration and its exact-symbol fallback"""
+        if ibkr_behavior == "success":
+            # Mock the IBKR reqMatchingSymbolsAsync API response for European company
+            # (e.g., Kongsberg)
+            mock_contract = ib_async_types.Contract()
+            mock_contract.symbol = "KOG"
+            mock_contract.exchange = "OSE"
+            mock_contract.currency = "NOK"
+            mock_contract.secType = "STK"
+            mock_contract.conId = 123456
+            mock_contract.country = "Norway"
+            mock_contract.primaryExchange = "OSE"
+            
+            mock_contract_desc = SimpleNamespace(
+                contract=mock_contract, description="Kongsberg Group ASA"
+            )
+            connected_ib.reqMatchingSymbolsAsync.return_value = [mock_contract_desc]
+            query = "Kongsberg"
+        else:
+            # Mock IBKR API to raise an exception
+            connected_ib.reqMatchingSymbolsAsync.side_effect = Exception("IBKR API error")
+            query = "TestSymbol"
         
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         # Mock the fallback exact symbol resolution
         intl_manager._resolve_exact_symbol = AsyncMock(return_value=[{
@@ -201,41 +303,47 @@ class TestInternationalManager:
             'currency': 'USD'
         }])
         
-        # Test fallback behavior
-        result = await intl_manager._resolve_fuzzy_search("TestSymbol")
+        result = await intl_manager._resolve_fuzzy_search(query)
         
-        # Should call the fallback method
-        intl_manager._resolve_exact_symbol.assert_called_once_with("TESTSYMBOL", None, None, "STK")
-        
-        # Should return fallback result
+        assert isinstance(result, list)
         assert len(result) == 1
-        assert result[0]['symbol'] == 'FALLBACK'
-
-    @pytest.mark.asyncio
-    async def test_resolve_symbol_alternative_ids(self, mock_ib):
-        """Test alternative ID resolution (CUSIP, ISIN, ConID)"""
-        mock_ib.isConnected.return_value = True
         
-        intl_manager = InternationalManager(mock_ib)
-        
-        # Test ConID resolution
-        result = await intl_manager.resolve_symbol("265598")  # Apple ConID
-        assert isinstance(result, dict)
+        if ibkr_behavior == "success":
+            # Verify the IBKR API was called
+            connected_ib.reqMatchingSymbolsAsync.assert_called_once_with("Kongsberg")
+            
+            # Check the result structure
+            first_match = result[0]
+            expected = {
+                'symbol': 'KOG', 'name': 'Kongsberg Group ASA', 'exchange': 'OSE',
+                'currency': 'NOK', 'country': 'Norway', 'conid': 123456,
+                'confidence': 0.9  # High confidence for IBKR matches
+            }
+            assert {k: first_match.get(k) for k in expected} == expected
+        else:
+            # Should call the fallback method and return its result
+            intl_manager._resolve_exact_symbol.assert_called_once_with("TESTSYMBOL", None, None, "STK")
+            assert result[0]['symbol'] == 'FALLBACK'
+
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("identifier", [
+        "265598",        # Apple ConID
+        "037833100",     # Apple CUSIP
+        "US0378331005",  # Apple ISIN
+    ], ids=["conid", "cusip", "isin"])
+    async def test_resolve_symbol_alternative_ids(self, intl_manager_factory, connected_ib, identifier):
+        """Test alternative ID resolution (CUSIP, ISIN, ConID)"""
         
-        # Test CUSIP pattern
-        result = await intl_manager.resolve_symbol("037833100")  # Apple CUSIP
-        assert isinstance(result, dict)
+        intl_manager = intl_manager_factory()
         
-        # Test ISIN pattern
-        result = await intl_manager.resolve_symbol("US0378331005")  # Apple ISIN
+        result = await intl_manager.resolve_symbol(identifier)
         assert isinstance(result, dict)
 
-    @pytest.mark.asyncio
-    async def test_resolve_symbol_confidence_scoring(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_resolve_symbol_confidence_scoring(self, intl_manager_factory, connected_ib):
         """Test confidence scoring algorithm"""
-        mock_ib.isConnected.return_value = True
         
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         # Test exact symbol match (should have high confidence)
         result = await intl_manager.resolve_symbol("AAPL")
@@ -246,12 +354,11 @@ class TestInternationalManager:
                 # Exact symbol matches should have high confidence
                 assert first_match['confidence'] >= 0.8
 
-    @pytest.mark.asyncio
-    async def test_resolve_symbol_max_results_parameter(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_resolve_symbol_max_results_parameter(self, intl_manager_factory, connected_ib):
         """Test max_results parameter functionality"""
-        mock_ib.isConnected.return_value = True
         
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         # Test max_results parameter
         result = await intl_manager.resolve_symbol("App", max_results=3, fuzzy_search=True)
@@ -261,29 +368,25 @@ class TestInternationalManager:
         # Should not exceed max_results
         assert len(result['matches']) <= 3
 
-    @pytest.mark.asyncio
-    async def test_resolve_symbol_include_alternatives(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_resolve_symbol_include_alternatives(self, intl_manager_factory, connected_ib):
         """Test include_alternatives parameter with direct IBKR API"""
         # Setup mock for direct IBKR API call with alternative IDs
-        mock_contract_detail = Mock()
-        mock_contract = Mock()
-        mock_contract.symbol = "AAPL"
-        mock_contract.exchange = "SMART"
-        mock_contract.currency = "USD"
-        mock_contract.conId = 265598
-        mock_contract.longName = "Apple Inc."
-        mock_contract.primaryExchange = "NASDAQ"
-        
-        mock_contract_detail.contract = mock_contract
-        mock_contract_detail.secIdList = [
-            Mock(tag="ISIN", value="US0378331005"),
-            Mock(tag="CUSIP", value="037833100")
-        ]
-        
-        mock_ib.isConnected.return_value = True
-        mock_ib.reqContractDetailsAsync = AsyncMock(return_value=[mock_contract_detail])
-        
-        intl_manager = InternationalManager(mock_ib)
+        mock_contract = SimpleNamespace(
+            symbol="AAPL", exchange="SMART", currency="USD", conId=265598,
+            longName="Apple Inc.", primaryExchange="NASDAQ"
+        )
+        mock_contract_detail = SimpleNamespace(
+            contract=mock_contract,
+            secIdList=[
+                SimpleNamespace(tag="ISIN", value="US0378331005"),
+                SimpleNamespace(tag="CUSIP", value="037833100")
+            ]
+        )
+        
+        connected_ib.reqContractDetailsAsync = AsyncMock(return_value=[mock_contract_detail])
+        
+        intl_manager = intl_manager_factory()
         
         # Test with include_alternatives=True - should include ISIN/CUSIP from IBKR data
         result = await intl_manager.resolve_symbol("AAPL", include_alternatives=True)
@@ -296,30 +399,34 @@ class TestInternationalManager:
             assert 'isin' in first_match
             assert 'cusip' in first_match
 
-    @pytest.mark.asyncio
-    async def test_resolve_symbol_cache_behavior(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_resolve_symbol_cache_behavior(self, intl_manager_factory, connected_ib):
         """Test cache behavior with enhanced caching"""
-        mock_ib.isConnected.return_value = True
-        
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
+        intl_manager._resolve_exact_symbol = AsyncMock(
+            return_value=[{'symbol': 'MSFT', 'exchange': 'SMART', 'currency': 'USD'}]
+        )
         
         # First call - should miss cache
         result1 = await intl_manager.resolve_symbol("MSFT")
         
-        # Second call - should potentially hit cache
+        # Second call - should hit cache
         result2 = await intl_manager.resolve_symbol("MSFT")
         
         # Both should return same structure
         assert isinstance(result1, dict)
         assert isinstance(result2, dict)
-        assert 'cache_info' in result1 or 'cache_info' in result2
+        assert result1['cache_info']['cache_hit'] is False
+        assert result2['cache_info']['cache_hit'] is True
+        
+        # Cache hit must skip the IBKR round trip entirely
+        intl_manager._resolve_exact_symbol.assert_awaited_once()
 
-    @pytest.mark.asyncio
-    async def test_resolve_symbol_parameter_validation(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_resolve_symbol_parameter_validation(self, intl_manager_factory, connected_ib):
         """Test parameter validation for new parameters"""
-        mock_ib.isConnected.return_value = True
         
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         # Test invalid max_results (should be 1-16)
         try:
@@ -331,13 +438,13 @@ class TestInternationalManager:
             # Should raise ValueError for invalid max_results
             assert True
 
-    @pytest.mark.asyncio
-    async def test_resolve_symbol_error_handling(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_resolve_symbol_error_handling(self, intl_manager_factory, mock_ib):
         """Test error handling in enhanced resolve_symbol"""
         # Test with disconnected IB
         mock_ib.isConnected.return_value = False
         
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         try:
             result = await intl_manager.resolve_symbol("AAPL")
@@ -347,102 +454,84 @@ class TestInternationalManager:
             # Should not raise unhandled exceptions
             assert "connection" in str(e).lower() or "not connected" in str(e).lower()
 
-    @pytest.mark.asyncio
-    async def test_get_market_data_success(self, mock_ib, sample_international_ticker):
-        """Test successful international market data retrieval"""
-        intl_manager = InternationalManager(mock_ib)
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("symbols,quotes", [
+        ("ASML", [("ASML", "AEB", "EUR", 650.80, 650.60, 651.00)]),
+        ("ASML,7203", [
+            ("ASML", "AEB", "EUR", 650.80, 650.60, 651.00),
+            ("7203", "TSE", "JPY", 2450.0, 2449.0, 2451.0),
+        ]),
+    ], ids=["single_symbol", "multiple_symbols"])
+    async def test_get_market_data(self, intl_manager_factory, mock_ib, make_intl_ticker, symbols, quotes):
+        """Test international market data retrieval for one or more symbols"""
+        intl_manager = intl_manager_factory()
         
-        # Setup mocks
-        mock_contract = Mock()
-        mock_contract.symbol = 'ASML'
-        mock_contract.exchange = 'AEB'
-        mock_contract.currency = 'EUR'
-        mock_ib.qualifyContractsAsync.return_value = [mock_contract]
-        mock_ib.reqTickersAsync.return_value = [sample_international_ticker]
+        # Setup one ticker per quote
+        tickers = [make_intl_ticker(*quote) for quote in quotes]
+        
+        mock_ib.qualifyContractsAsync.return_value = [t.contract for t in tickers]
+        mock_ib.reqTickersAsync.return_value = tickers
         
         # Test market data retrieval
-        data = await intl_manager.get_international_market_data("ASML")
-        
-        assert len(data) == 1
-        assert data[0]['symbol'] == 'ASML'
-        assert data[0]['exchange'] == 'AEB'
-        assert data[0]['currency'] == 'EUR'
-        assert 'last' in data[0]
-        assert 'timestamp' in data[0]
+        data = await intl_manager.get_international_market_data(symbols)
+        
+        assert len(data) == len(quotes)
+        for row, (symbol, exchange, currency, last, _, _) in zip(data, quotes):
+            assert row['symbol'] == symbol
+            assert row['exchange'] == exchange
+            assert row['currency'] == currency
+            assert row['last'] == last
+            assert 'timestamp' in row
     
-    @pytest.mark.asyncio
-    async def test_get_market_data_multiple_symbols(self, mock_ib):
-        """Test retrieving market data for multiple international symbols"""
-        intl_manager = InternationalManager(mock_ib)
-        
-        # Setup multiple tickers
-        ticker1 = Mock()
-        ticker1.contract.symbol = 'ASML'
-        ticker1.contract.exchange = 'AEB'
-        ticker1.contract.currency = 'EUR'
-        ticker1.last = 650.80
-        ticker1.bid = 650.60
-        ticker1.ask = 651.00
-        
-        ticker2 = Mock()
-        ticker2.contract.symbol = '7203'
-        ticker2.contract.exchange = 'TSE'
-        ticker2.contract.currency = 'JPY'
-        ticker2.last = 2450.0
-        ticker2.bid = 2449.0
-        ticker2.ask = 2451.0
-        
-        mock_ib.qualifyContractsAsync.return_value = [Mock(), Mock()]
-        mock_ib.reqTickersAsync.return_value = [ticker1, ticker2]
-        
-        # Test multiple symbols
-        data = await intl_manager.get_international_market_data("ASML,7203")
-        
-        assert len(data) == 2
-        assert data[0]['symbol'] == 'ASML'
-        assert data[1]['symbol'] == '7203'
-        assert data[0]['last'] == 650.80
-        assert data[1]['last'] == 2450.0
-    
-    def test_get_supported_exchanges(self, mock_ib):
+    def test_get_supported_exchanges(self, intl_manager_factory):
         """Test getting supported exchanges"""
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         exchanges = intl_manager.get_supported_exchanges()
         
         assert isinstance(exchanges, list)
         assert len(exchanges) > 0
         # Should include major international exchanges
-        exchange_codes = [ex.get('code') for ex in exchanges]
-        assert 'AEB' in exchange_codes  # Amsterdam
-        assert 'XETRA' in exchange_codes  # Frankfurt
-        assert 'TSE' in exchange_codes  # Tokyo
+        exchange_codes = frozenset(ex.get('code') for ex in exchanges)
+        assert _EXPECTED_EXCHANGES <= exchange_codes, _EXPECTED_EXCHANGES - exchange_codes
+    
+    def test_get_supported_exchanges_cached(self, intl_manager_factory):
+        """Test static exchange details are built once and reused"""
+        intl_manager = intl_manager_factory()
+        
+        first = intl_manager.get_supported_exchanges()
+        cached_details = intl_manager._supported_exchange_details
+        second = intl_manager.get_supported_exchanges()
+        
+        assert isinstance(cached_details, tuple)
+        assert intl_manager._supported_exchange_details is cached_details
+        assert [ex['code'] for ex in first] == [ex['code'] for ex in second]
+        # Live market status is still reported on every call
+        assert all('market_open' in ex for ex in second)
     
-    def test_get_supported_symbols(self, mock_ib):
+    def test_get_supported_symbols(self, intl_manager_factory, mock_ib):
         """Test that symbol resolution now works through IBKR API instead of database"""
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         # New implementation no longer uses a static symbol database
         # Symbol resolution is now dynamic through IBKR API
+        attrs = set(dir(intl_manager))
+        
         # Test that we no longer have symbol_db attribute
-        assert not hasattr(intl_manager, 'symbol_db')
+        assert 'symbol_db' not in attrs
         
-        # Test that we still have the essential components for IBKR API resolution
-        assert hasattr(intl_manager, 'ib')  # IBKR client
-        assert hasattr(intl_manager, 'exchange_mgr')  # Exchange manager for validation
-        assert hasattr(intl_manager, 'resolve_symbol')  # Main resolution method
+        # Test that we still have the essential components for IBKR API resolution:
+        # IBKR client, exchange manager for validation, main resolution method
+        expected = {'ib', 'exchange_mgr', 'resolve_symbol'}
+        assert expected <= attrs, expected - attrs
         
         # Verify the new implementation works through IBKR API
         assert intl_manager.ib == mock_ib
     
-    @pytest.mark.asyncio
-    async def test_auto_detect_exchange(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_auto_detect_exchange(self, intl_manager_factory, connected_empty_ib):
         """Test automatic exchange detection for symbols"""
-        # Setup mock for connected API
-        mock_ib.isConnected.return_value = True
-        mock_ib.qualifyContractsAsync = AsyncMock(return_value=[])  # No matches for test
-        
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         # Test known symbol auto-detection - resolve_symbol is NOW async
         result = await intl_manager.resolve_symbol("ASML")
@@ -453,13 +542,14 @@ class TestInternationalManager:
 
 
 @pytest.mark.unit
+@pytest.mark.xdist_group(name="international_manager")
 class TestInternationalManagerErrorHandling:
     """Test international manager error handling"""
     
-    @pytest.mark.asyncio
-    async def test_connection_error_handling(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_connection_error_handling(self, intl_manager_factory, mock_ib):
         """Test handling of connection errors"""
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         # Simulate connection error
         mock_ib.qualifyContractsAsync.side_effect = Exception("Connection lost")
@@ -470,10 +560,10 @@ class TestInternationalManagerErrorHandling:
         # Should propagate connection error
         assert "Connection lost" in str(exc_info.value) or "error" in str(exc_info.value).lower()
     
-    @pytest.mark.asyncio
-    async def test_empty_ticker_response(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_empty_ticker_response(self, intl_manager_factory, mock_ib):
         """Test handling of empty ticker responses"""
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         # Setup empty response
         mock_ib.qualifyContractsAsync.return_value = []
@@ -485,29 +575,21 @@ class TestInternationalManagerErrorHandling:
         
         assert "qualify" in str(exc_info.value).lower()
     
-    @pytest.mark.asyncio
-    async def test_market_data_subscription_error(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_market_data_subscription_error(self, intl_manager_factory, mock_ib):
         """Test handling of IBKR subscription errors (error 10089)"""
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         # Setup valid contract but no market data subscription
-        from ib_async import Stock, Ticker
-        mock_contract = Mock(spec=Stock)
-        mock_contract.symbol = "AAPL"
-        mock_contract.exchange = "SMART"
-        mock_contract.currency = "USD"
-        mock_contract.conId = 265598
+        mock_contract = SimpleNamespace(
+            symbol="AAPL", exchange="SMART", currency="USD", conId=265598
+        )
         
         # Create ticker with zero prices (subscription issue)
-        mock_ticker = Mock(spec=Ticker)
-        mock_ticker.contract = mock_contract
-        mock_ticker.last = 0.0
-        mock_ticker.bid = 0.0
-        mock_ticker.ask = 0.0
-        mock_ticker.close = 0.0
-        mock_ticker.high = 0.0
-        mock_ticker.low = 0.0
-        mock_ticker.volume = 0
+        mock_ticker = SimpleNamespace(
+            contract=mock_contract, last=0.0, bid=0.0, ask=0.0,
+            close=0.0, high=0.0, low=0.0, volume=0
+        )
         
         mock_ib.qualifyContractsAsync.return_value = [mock_contract]
         mock_ib.reqTickersAsync.return_value = [mock_ticker]
@@ -522,14 +604,10 @@ class TestInternationalManagerErrorHandling:
         assert ticker_data["data_status"] in ["delayed", "unavailable"]
         assert "data_message" in ticker_data
     
-    @pytest.mark.asyncio
-    async def test_invalid_symbol_format(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_invalid_symbol_format(self, intl_manager_factory, connected_empty_ib):
         """Test handling of invalid symbol formats"""
-        intl_manager = InternationalManager(mock_ib)
-        
-        # Setup mock for IB API - should handle empty symbol
-        mock_ib.isConnected.return_value = True
-        mock_ib.qualifyContractsAsync = AsyncMock(return_value=[])  # No qualified contracts
+        intl_manager = intl_manager_factory()
         
         # Test with invalid symbol format - resolve_symbol is NOW async
         result = await intl_manager.resolve_symbol("")
@@ -541,13 +619,13 @@ class TestInternationalManagerErrorHandling:
         if 'matches' in result:
             assert len(result['matches']) == 0
     
-    @pytest.mark.asyncio
-    async def test_market_data_timeout(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_market_data_timeout(self, intl_manager_factory, mock_ib):
         """Test handling of market data timeouts"""
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         # Simulate timeout
-        mock_ib.reqTickersAsync.side_effect = asyncio.TimeoutError("Request timeout")
+        mock_ib.reqTickersAsync.side_effect = TimeoutError("Request timeout")
         
         with pytest.raises(Exception) as exc_info:
             await intl_manager.get_international_market_data("ASML")
@@ -557,136 +635,68 @@ class TestInternationalManagerErrorHandling:
 
 
 @pytest.mark.unit
+@pytest.mark.xdist_group(name="international_manager")
 class TestInternationalManagerValidation:
     """Test international manager validation functionality"""
     
-    def test_symbol_validation(self, mock_ib):
+    @pytest.mark.skipif(not hasattr(InternationalManager, 'validate_symbol'),
+                        reason="method not implemented on this InternationalManager build")
+    def test_symbol_validation(self, intl_manager_factory):
         """Test symbol validation methods"""
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
-        # Test if validation method exists, otherwise pass
-        if hasattr(intl_manager, 'validate_symbol'):
-            # Test valid symbols
-            assert intl_manager.validate_symbol("ASML") or True
-            assert intl_manager.validate_symbol("7203") or True
-            
-            # Test invalid symbols
-            result = intl_manager.validate_symbol("")
-            assert result is False or result is None
-        else:
-            # Method doesn't exist, pass the test
-            assert True
+        # Test valid symbols
+        assert intl_manager.validate_symbol("ASML") or True
+        assert intl_manager.validate_symbol("7203") or True
+        
+        # Test invalid symbols
+        result = intl_manager.validate_symbol("")
+        assert result is False or result is None
     
-    def test_exchange_validation(self, mock_ib):
+    @pytest.mark.skipif(not hasattr(InternationalManager, 'validate_exchange'),
+                        reason="method not implemented on this InternationalManager build")
+    def test_exchange_validation(self, intl_manager_factory):
         """Test exchange validation methods"""
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
-        # Test if validation method exists, otherwise pass
-        if hasattr(intl_manager, 'validate_exchange'):
-            # Test valid exchanges
-            assert intl_manager.validate_exchange("AEB") or True
-            assert intl_manager.validate_exchange("TSE") or True
-            
-            # Test invalid exchange
-            result = intl_manager.validate_exchange("INVALID")
-            assert result is False or result is None
-        else:
-            # Method doesn't exist, pass the test
-            assert True
+        # Test valid exchanges
+        assert intl_manager.validate_exchange("AEB") or True
+        assert intl_manager.validate_exchange("TSE") or True
+        
+        # Test invalid exchange
+        result = intl_manager.validate_exchange("INVALID")
+        assert result is False or result is None
     
-    def test_currency_validation(self, mock_ib):
+    @pytest.mark.skipif(not hasattr(InternationalManager, 'validate_currency'),
+                        reason="method not implemented on this InternationalManager build")
+    def test_currency_validation(self, intl_manager_factory):
         """Test currency validation methods"""
-        intl_manager = InternationalManager(mock_ib)
-        
-        # Test if validation method exists, otherwise pass
-        if hasattr(intl_manager, 'validate_currency'):
-            # Test valid currencies
-            assert intl_manager.validate_currency("EUR") or True
-            assert intl_manager.validate_currency("JPY") or True
-            
-            # Test invalid currency
-            result = intl_manager.validate_currency("INVALID")
-            assert result is False or result is None
-        else:
-            # Method doesn't exist, pass the test
-            assert True
-
-
-
-
-    @pytest.mark.asyncio
-    async def test_international_manager_fallback(self, mock_ib):
-        """Test fallback mechanisms for symbol resolution"""
-        intl_manager = InternationalManager(mock_ib)
-        
-        # Setup mock for IB API
-        mock_ib.isConnected.return_value = True
-        mock_ib.qualifyContractsAsync = AsyncMock(return_value=[])  # No qualified contracts
-        
-        # Test 1: Database fallback to guessed matches
-        # When database has no match, should fallback to guessing
-        result = await intl_manager.resolve_symbol("UNKNOWN_SYMBOL")
-        assert result['symbol'] == "UNKNOWN_SYMBOL"
-        assert 'matches' in result
-        assert 'resolution_method' in result
-        # Should either have database matches or fallback method
-        assert result['resolution_method'] in ['database', 'guessed', 'none', 'error']
-        
-        # Test 2: Error handling fallback  
-        # When everything fails, should return error structure gracefully
-        result_error = await intl_manager.resolve_symbol("")  # Empty symbol
-        assert result_error['symbol'] == ""
-        assert 'matches' in result_error
-        assert isinstance(result_error.get('matches'), list)
+        intl_manager = intl_manager_factory()
         
-        # Test 3: Market data fallback when contracts fail
-        mock_ib.qualifyContractsAsync.return_value = []  # Empty response
-        mock_ib.reqTickersAsync.return_value = []  # Empty response
+        # Test valid currencies
+        assert intl_manager.validate_currency("EUR") or True
+        assert intl_manager.validate_currency("JPY") or True
         
-        try:
-            market_data = await intl_manager.get_international_market_data(["UNKNOWN_SYM"])
-            # Should handle gracefully and return empty or error
-            assert isinstance(market_data, (list, dict))
-        except Exception as e:
-            # Should provide meaningful error messages
-            assert isinstance(e, (ValueError, ConnectionError)) or "qualify" in str(e).lower()
-        
-        # Test 4: Successful fallback to SMART routing
-        fallback_contract = Mock()
-        fallback_contract.symbol = "AAPL"
-        fallback_contract.exchange = "SMART"
-        fallback_contract.currency = "USD"
-        fallback_contract.conId = 265598
-        
-        mock_ticker = Mock()
-        mock_ticker.contract = fallback_contract
-        mock_ticker.last = 180.50
-        mock_ticker.bid = 180.48
-        mock_ticker.ask = 180.52
-        
-        mock_ib.qualifyContractsAsync.return_value = [fallback_contract]
-        mock_ib.reqTickersAsync.return_value = [mock_ticker]
-        
-        # Test successful market data with fallback routing
-        try:
-            market_data = await intl_manager.get_international_market_data(["AAPL"])
-            if market_data and len(market_data) > 0:
-                assert market_data[0]['symbol'] == "AAPL"
-                assert 'last' in market_data[0]
-        except Exception:
-            # Fallback test - should not fail catastrophically
-            assert True  # Test passes if no major exception
+        # Test invalid currency
+        result = intl_manager.validate_currency("INVALID")
+        assert result is False or result is None
 
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("scenario", list(_FALLBACK_SCENARIOS))
+    async def test_international_manager_fallback(self, intl_manager_factory, connected_empty_ib, scenario):
+        """Test fallback mechanisms for symbol resolution and market data"""
+        intl_manager = intl_manager_factory()
+        
+        await _FALLBACK_SCENARIOS[scenario](intl_manager, connected_empty_ib)
 
     # === PHASE 4.3 RATE LIMITING TESTS ===
     # These tests specifically validate the rate limiting implementation
     # added in Phase 4.3 of the unified symbol resolution project
 
-    @pytest.mark.asyncio
-    async def test_fuzzy_search_rate_limiting_enforcement(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_fuzzy_search_rate_limiting_enforcement(self, intl_manager_factory, connected_ib, frozen_time):
         """Test fuzzy search rate limiting enforcement (Phase 4.3)"""
-        mock_ib.isConnected.return_value = True
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         # Test _should_rate_limit_fuzzy_search() function
         # First call should not be rate limited
@@ -698,18 +708,16 @@ class TestInternationalManagerValidation:
         # Immediate second call should be rate limited (within 1 second)
         assert intl_manager._should_rate_limit_fuzzy_search()
         
-        # Simulate time passage by setting an old timestamp
-        old_time = datetime.now(timezone.utc) - timedelta(seconds=2)
-        intl_manager.rate_limiting['last_fuzzy_search'] = old_time
+        # Simulate time passage
+        frozen_time(2)
         
         # After 2 seconds, should not be rate limited
         assert not intl_manager._should_rate_limit_fuzzy_search()
 
-    @pytest.mark.asyncio 
-    async def test_rate_limit_enforcement_in_resolve_symbol(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_rate_limit_enforcement_in_resolve_symbol(self, intl_manager_factory, connected_ib, frozen_time):
         """Test rate limiting integration in _enforce_rate_limiting (Phase 4.3)"""
-        mock_ib.isConnected.return_value = True
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         # Test 1: First call should pass rate limiting
         result1 = await intl_manager._enforce_rate_limiting()
@@ -720,22 +728,37 @@ class TestInternationalManagerValidation:
         assert result2 is False, "Immediate second call should be rate limited"
         
         # Test 3: Simulate time passage - rate limiting should be reset
-        old_time = datetime.now(timezone.utc) - timedelta(seconds=2)
-        intl_manager.rate_limiting['last_fuzzy_search'] = old_time
+        frozen_time(2)
         
         result3 = await intl_manager._enforce_rate_limiting()
         assert result3 is True, "After time passage, rate limiting should allow request"
-            # When rate limited, should indicate fuzzy search was skipped
 
-    @pytest.mark.asyncio
-    async def test_rate_limit_cache_first_strategy(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("decision,allowed", [
+        (FuzzyDecision.ALLOW, True),
+        (FuzzyDecision.RATE_LIMIT, False),
+        (FuzzyDecision.DEGRADE, False),
+    ], ids=["allow", "rate_limit", "degrade"])
+    async def test_enforce_rate_limiting_follows_fuzzy_decision(self, intl_manager_factory, decision, allowed):
+        """Test _enforce_rate_limiting only lets a fuzzy search through on ALLOW"""
+        intl_manager = intl_manager_factory()
+        intl_manager._fuzzy_decision = Mock(return_value=decision)
+        intl_manager._update_fuzzy_search_timing = Mock()
+        
+        assert await intl_manager._enforce_rate_limiting() is allowed
+        
+        # Only an allowed search starts a new rate limiting interval
+        assert intl_manager._update_fuzzy_search_timing.called is allowed
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_rate_limit_cache_first_strategy(self, stubbed_manager):
         """Test cache-first strategy when rate limited (Phase 4.3)"""
-        mock_ib.isConnected.return_value = True
-        intl_manager = InternationalManager(mock_ib)
+        # Exact resolution fails, which would normally trigger fuzzy search
+        intl_manager = stubbed_manager()
         
         # Setup cache with known result using correct cache key format 
         test_symbol = "AAPL"
-        cache_key = f"{test_symbol.upper()}_None_None_STK_5_False"  # Matches actual implementation: {symbol}_{exchange}_{currency}_{sec_type}_{max_results}_{prefer_native_exchange}
+        cache_key = (test_symbol.upper(), None, None, "STK", 5, False)  # (symbol, exchange, currency, sec_type, max_results, prefer_native_exchange)
         cached_result = {
             'symbol': test_symbol,
             'matches': [{'symbol': 'AAPL', 'confidence': 0.9}],
@@ -743,18 +766,13 @@ class TestInternationalManagerValidation:
         }
         
         # Use actual cache structure with timestamp and data fields
-        intl_manager.resolution_cache[cache_key] = {
-            'data': cached_result,
-            'timestamp': datetime.now(timezone.utc).timestamp(),
-            'hit_count': 0
-        }
+        intl_manager.resolution_cache[cache_key] = CacheEntry(
+            cached_result, datetime.now(timezone.utc).timestamp()
+        )
         
         # Trigger rate limiting
         intl_manager._update_fuzzy_search_timing()
         
-        # Mock exact resolution to fail (would normally trigger fuzzy search)
-        intl_manager._resolve_exact_symbol = AsyncMock(return_value=[])
-        
         # Should return cached result instead of attempting rate-limited fuzzy search
         result = await intl_manager.resolve_symbol(test_symbol, fuzzy_search=True)
         
@@ -764,76 +782,203 @@ class TestInternationalManagerValidation:
         assert 'cache_info' in result
         assert result['cache_info']['cache_hit'] is True
 
-    @pytest.mark.asyncio
-    async def test_fuzzy_search_degradation_scenarios(self, mock_ib):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_early_refresh_is_single_flight(self, stubbed_manager, monkeypatch):
+        """Test concurrent hits on a nearly expired entry trigger exactly one background refresh"""
+        import ibkr_mcp_server.trading.international as intl_module
+        
+        intl_manager = stubbed_manager()
+        release = asyncio.Event()
+        
+        async def _slow_fuzzy(*args, **kwargs):
+            # Hold the refresh open until every concurrent caller has been served
+            await release.wait()
+            return [{'symbol': 'AAPL', 'exchange': 'SMART', 'currency': 'USD'}]
+        
+        intl_manager._resolve_fuzzy_search = AsyncMock(side_effect=_slow_fuzzy)
+        
+        cache_key = ("APPLE", None, None, "STK", 5, False)
+        almost_expired = datetime.now(timezone.utc).timestamp() - intl_manager.cache_duration + 1
+        intl_manager.resolution_cache[cache_key] = CacheEntry({'symbol': 'Apple', 'matches': []}, almost_expired)
+        
+        # Pin the early-refresh draw so every hit asks for a refresh
+        monkeypatch.setattr(intl_module, "random", lambda: 0.0)
+        
+        results = await asyncio.gather(*(intl_manager.resolve_symbol("Apple") for _ in range(50)))
+        
+        # Every caller is served from cache while a single refresh runs behind them
+        assert all(result['cache_info']['cache_hit'] for result in results)
+        assert len(intl_manager._refresh_tasks) == 1
+        
+        release.set()
+        await asyncio.gather(*intl_manager._refresh_tasks.values())
+        intl_manager._resolve_fuzzy_search.assert_awaited_once()
+        assert intl_manager.resolution_cache[cache_key].timestamp > almost_expired
+        assert intl_manager.resolution_cache[cache_key].data['matches'][0]['symbol'] == 'AAPL'
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_fuzzy_search_degradation_scenarios(self, intl_manager_factory, connected_ib, async_stub):
         """Test graceful degradation scenarios (Phase 4.3)"""
-        mock_ib.isConnected.return_value = True
-        intl_manager = InternationalManager(mock_ib)
+        # Exact resolution fails; the real fuzzy search runs and hits the degradation check
+        intl_manager = intl_manager_factory()
+        intl_manager._resolve_exact_symbol = async_stub([])
         
-        # Test _should_degrade_fuzzy_search() - simulate high API usage
-        with patch.object(intl_manager, '_should_degrade_fuzzy_search', return_value=True):
-            # Mock exact resolution failure to trigger fuzzy search path
-            intl_manager._resolve_exact_symbol = AsyncMock(return_value=[])
-            
-            result = await intl_manager.resolve_symbol("TestSymbol", fuzzy_search=True)
-            
-            # Should handle degradation gracefully
-            assert isinstance(result, dict)
-            assert 'matches' in result
-            assert 'resolution_method' in result
-            # During degradation, should skip fuzzy search
-            
-    @pytest.mark.asyncio
-    async def test_rate_limiting_configuration_settings(self, mock_ib):
+        # Simulate high API usage via the fuzzy search decision
+        # (fresh manager per test, so direct assignment needs no restore)
+        intl_manager._fuzzy_decision = Mock(return_value=FuzzyDecision.DEGRADE)
+        
+        result = await intl_manager.resolve_symbol("TestSymbol", fuzzy_search=True)
+        
+        # During degradation, fuzzy search is skipped without calling IBKR
+        intl_manager._fuzzy_decision.assert_called_once()
+        connected_ib.reqMatchingSymbolsAsync.assert_not_awaited()
+        assert result['matches'] == []
+        assert result['resolution_method'] == 'none'
+
+    def test_fuzzy_search_degradation_recovery(self, intl_manager_factory, frozen_time):
+        """Test degraded mode ends a minute after the last fuzzy search"""
+        intl_manager = intl_manager_factory()
+        intl_manager.rate_limiting['fuzzy_search_degraded'] = True
+        intl_manager._update_fuzzy_search_timing()
+        
+        frozen_time(59)
+        assert intl_manager._should_degrade_fuzzy_search()
+        
+        frozen_time(2)
+        assert not intl_manager._should_degrade_fuzzy_search()
+        assert intl_manager.rate_limiting['fuzzy_search_degraded'] is False
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_rate_limiting_configuration_settings(self, intl_manager_factory, connected_ib, frozen_time):
         """Test rate limiting uses 1-second hardcoded interval (Phase 4.3)"""
-        mock_ib.isConnected.return_value = True
-        intl_manager = InternationalManager(mock_ib)
+        intl_manager = intl_manager_factory()
         
         # Test initial state - no rate limiting
         assert not intl_manager._should_rate_limit_fuzzy_search()
+        assert intl_manager._fuzzy_decision() is FuzzyDecision.ALLOW
         
         # Update timing to trigger rate limiting
         intl_manager._update_fuzzy_search_timing()
         
         # Should be rate limited within 1 second (hardcoded)
         assert intl_manager._should_rate_limit_fuzzy_search()
+        assert intl_manager._fuzzy_decision() is FuzzyDecision.RATE_LIMIT
+        
+        # Still inside the 1-second window
+        frozen_time(0.9)
+        assert intl_manager._should_rate_limit_fuzzy_search()
         
         # Simulate time passage - should not be rate limited after 1+ seconds
-        past_time = datetime.now(timezone.utc) - timedelta(seconds=1.5)
-        intl_manager.rate_limiting['last_fuzzy_search'] = past_time
+        frozen_time(0.6)
         
         assert not intl_manager._should_rate_limit_fuzzy_search()
+        assert intl_manager._fuzzy_decision() is FuzzyDecision.ALLOW
 
-    @pytest.mark.asyncio 
-    async def test_api_call_tracking_and_monitoring(self, mock_ib):
+    def test_api_call_tracking_and_monitoring(self, intl_manager_factory, frozen_time):
         """Test API call tracking and monitoring (Phase 4.3)"""
-        mock_ib.isConnected.return_value = True
-        intl_manager = InternationalManager(mock_ib)
-        
-        # Reset API call tracking
-        if hasattr(intl_manager, '_api_calls_this_hour'):
-            intl_manager._api_calls_this_hour = 0
-        if hasattr(intl_manager, '_hour_start_time'):
-            intl_manager._hour_start_time = time.time()
-        
-        # Test API call tracking increment
-        initial_count = getattr(intl_manager, '_api_calls_this_hour', 0)
-        
-        # Mock API call that should increment counter
-        with patch.object(intl_manager, '_resolve_fuzzy_search', new_callable=AsyncMock) as mock_fuzzy:
-            mock_fuzzy.return_value = []
-            intl_manager._resolve_exact_symbol = AsyncMock(return_value=[])
-            
-            # This should trigger fuzzy search and increment API call counter
-            await intl_manager.resolve_symbol("TestSymbol", fuzzy_search=True)
-            
-            # Verify API call was attempted (mocked but tracked)
-            if hasattr(intl_manager, '_api_calls_this_hour'):
-                assert intl_manager._api_calls_this_hour >= initial_count
+        intl_manager = intl_manager_factory()
+        
+        initial_count = len(intl_manager._api_call_log)
+        initial_last_hour = intl_manager._api_calls_in_last_hour()
+        
+        intl_manager._track_api_call('req_matching_symbols')
+        
+        # Exactly one call lands in the sliding window and the hourly count follows it
+        assert len(intl_manager._api_call_log) == initial_count + 1
+        assert intl_manager._api_calls_in_last_hour() == initial_last_hour + 1
+        assert intl_manager.api_call_stats['last_hour_calls'] == initial_last_hour + 1
+        assert intl_manager.api_call_stats['req_matching_symbols_calls'] == 1
+    
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_concurrent_misses_share_one_resolution(self, stubbed_manager):
+        """Test concurrent cache misses for the same symbol resolve through one lookup"""
+        intl_manager = stubbed_manager()
+        release = asyncio.Event()
+        
+        async def _slow_fuzzy(*args, **kwargs):
+            # Keep the first lookup in flight while the second caller arrives
+            await release.wait()
+            return [{'symbol': 'TSLA', 'exchange': 'SMART', 'currency': 'USD'}]
+        
+        intl_manager._resolve_fuzzy_search = AsyncMock(side_effect=_slow_fuzzy)
+        
+        pending = asyncio.gather(intl_manager.resolve_symbol("Tesla"), intl_manager.resolve_symbol("Tesla"))
+        await asyncio.sleep(0)
+        assert len(intl_manager._inflight) == 1
+        
+        release.set()
+        first, second = await pending
+        
+        intl_manager._resolve_fuzzy_search.assert_awaited_once()
+        # Equal results, but each caller owns its dict
+        assert first == second
+        assert first is not second
+        assert first['matches'][0]['symbol'] == 'TSLA'
+        assert not intl_manager._inflight
+    
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_miss_during_refresh_joins_it(self, stubbed_manager, monkeypatch):
+        """Test a cache miss while a background refresh runs waits on that refresh instead of calling IBKR again"""
+        import ibkr_mcp_server.trading.international as intl_module
+        
+        intl_manager = stubbed_manager()
+        release = asyncio.Event()
+        
+        async def _slow_fuzzy(*args, **kwargs):
+            await release.wait()
+            return [{'symbol': 'AAPL', 'exchange': 'SMART', 'currency': 'USD'}]
+        
+        intl_manager._resolve_fuzzy_search = AsyncMock(side_effect=_slow_fuzzy)
+        
+        cache_key = ("APPLE", None, None, "STK", 5, False)
+        almost_expired = datetime.now(timezone.utc).timestamp() - intl_manager.cache_duration + 1
+        intl_manager.resolution_cache[cache_key] = CacheEntry({'symbol': 'Apple', 'matches': []}, almost_expired)
+        monkeypatch.setattr(intl_module, "random", lambda: 0.0)
+        
+        # Hit schedules the refresh, then the entry expires before the refresh lands
+        await intl_manager.resolve_symbol("Apple")
+        del intl_manager.resolution_cache[cache_key]
+        pending = asyncio.ensure_future(intl_manager.resolve_symbol("Apple"))
+        await asyncio.sleep(0)
+        
+        release.set()
+        result = await pending
+        await asyncio.gather(*intl_manager._refresh_tasks.values())
+        
+        intl_manager._resolve_fuzzy_search.assert_awaited_once()
+        assert result['matches'][0]['symbol'] == 'AAPL'
+    
+    def test_api_call_sliding_window(self, intl_manager_factory, frozen_time):
+        """Test API calls age out of a trailing one-hour window rather than a clock-hour bucket"""
+        intl_manager = intl_manager_factory()
+        
+        intl_manager._update_hourly_api_calls()
+        frozen_time(1800)
+        intl_manager._update_hourly_api_calls()
+        assert intl_manager.api_call_stats['last_hour_calls'] == 2
+        
+        # First call leaves the window an hour after it was made
+        frozen_time(1801)
+        assert intl_manager._api_calls_in_last_hour() == 1
+        assert len(intl_manager._api_call_log) == 1
+        
+        frozen_time(1800)
+        assert intl_manager._api_calls_in_last_hour() == 0
+    
+    def test_degradation_uses_trailing_hour_call_count(self, intl_manager_factory, frozen_time):
+        """Test degraded mode triggers once more than 100 calls fall within the last hour"""
+        intl_manager = intl_manager_factory()
+        
+        for _ in range(100):
+            intl_manager._update_hourly_api_calls()
+        assert not intl_manager._should_degrade_fuzzy_search()
+        assert intl_manager._fuzzy_decision() is FuzzyDecision.ALLOW
+        
+        intl_manager._update_hourly_api_calls()
+        assert intl_manager._should_degrade_fuzzy_search()
+        assert intl_manager._fuzzy_decision() is FuzzyDecision.DEGRADE
 
 
 if __name__ == "__main__":
-    # Import time module for rate limiting tests
-    import time
     # Run international manager tests
     pytest.main([__file__, "-v", "--tb=short"])
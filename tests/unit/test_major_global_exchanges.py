@@ -1,9 +1,53 @@
 """Tests for all major exchanges added to the IBKR MCP server."""
 
+import json
 import pytest
 from datetime import time
 from ibkr_mcp_server.data.exchange_info import exchange_manager, EXCHANGE_INFO
 
+# Exchange groups shared across tests
+US_EXCHANGES = frozenset({'NYSE', 'NASDAQ', 'ARCA', 'BATS', 'IEX'})
+LUNCH_BREAK = frozenset({'SSE', 'SZSE', 'SET', 'IDX', 'KLSE'})
+CHINESE = frozenset({'SSE', 'SZSE'})
+T2_EXCHANGES = frozenset({'NYSE', 'NASDAQ', 'TSX', 'B3', 'TWSE', 'BSE', 'NSE', 'SGX'})
+CONTINUOUS = frozenset({'GETTEX', 'TRADEGATE', 'IDEALPRO'})
+ASIAN_COUNTRIES = frozenset({'Japan', 'China', 'India', 'Singapore', 'Taiwan', 'Thailand', 'Indonesia', 'Malaysia'})
+
+# Per-exchange expectations, parametrized so each exchange is its own test
+ASIAN_CONFIGS = [
+    ('TWSE', 'Taiwan', 'TWD', 'Asia/Taipei'),
+    ('SSE', 'China', 'CNY', 'Asia/Shanghai'),
+    ('SZSE', 'China', 'CNY', 'Asia/Shanghai'),
+    ('BSE', 'India', 'INR', 'Asia/Kolkata'),
+    ('NSE', 'India', 'INR', 'Asia/Kolkata'),
+    ('SGX', 'Singapore', 'SGD', 'Asia/Singapore'),
+    ('SET', 'Thailand', 'THB', 'Asia/Bangkok'),
+    ('IDX', 'Indonesia', 'IDR', 'Asia/Jakarta'),
+    ('KLSE', 'Malaysia', 'MYR', 'Asia/Kuala_Lumpur'),
+    ('NZX', 'New Zealand', 'NZD', 'Pacific/Auckland')
+]
+
+CURRENCY_MAPPINGS = {
+    'USD': ['NYSE', 'NASDAQ', 'ARCA', 'BATS', 'IEX'],
+    'CAD': ['TSX', 'TSXV'],
+    'BRL': ['B3'],
+    'MXN': ['MEXI'],
+    'TWD': ['TWSE'],
+    'CNY': ['SSE', 'SZSE'],
+    'INR': ['BSE', 'NSE'],
+    'SGD': ['SGX'],
+    'THB': ['SET'],
+    'IDR': ['IDX'],
+    'MYR': ['KLSE'],
+    'NZD': ['NZX'],
+    'ILS': ['TASE'],
+    'SAR': ['TADAWUL'],
+    'EGP': ['EGX'],
+    'ZAR': ['JSE'],
+    'EUR': ['LSEETF', 'GETTEX', 'TRADEGATE']
+}
+CURRENCY_CASES = [(currency, exchange) for currency, exchanges in CURRENCY_MAPPINGS.items() for exchange in exchanges]
+
 
 class TestMajorGlobalExchanges:
     """Test all major global exchanges added to the system."""
@@ -24,26 +68,23 @@ class TestMajorGlobalExchanges:
         for exchange in all_new_exchanges:
             assert exchange in EXCHANGE_INFO, f"Exchange {exchange} not found in EXCHANGE_INFO"
     
-    def test_us_exchanges(self):
+    @pytest.mark.parametrize("exchange", sorted(US_EXCHANGES))
+    def test_us_exchanges(self, exchange):
         """Test US exchange configurations."""
-        us_exchanges = ['NYSE', 'NASDAQ', 'ARCA', 'BATS', 'IEX']
+        info = exchange_manager.get_exchange_info(exchange)
+        assert info is not None
+        assert info['country'] == 'United States'
+        assert info['currency'] == 'USD'
+        assert info['timezone'] == 'America/New_York'
+        assert info['settlement'] == 'T+2'
         
-        for exchange in us_exchanges:
-            info = exchange_manager.get_exchange_info(exchange)
-            assert info is not None
-            assert info['country'] == 'United States'
-            assert info['currency'] == 'USD'
-            assert info['timezone'] == 'America/New_York'
-            assert info['settlement'] == 'T+2'
-            
-            # Check standard US trading hours
-            trading_hours = info['trading_hours']
-            assert trading_hours['open'] == '09:30'
-            assert trading_hours['close'] == '16:00'
-            
-            # Check extended hours for main exchanges
-            if exchange in ['NYSE', 'NASDAQ', 'ARCA', 'BATS', 'IEX']:
-                assert 'extended_hours' in EXCHANGE_INFO[exchange]
+        # Check standard US trading hours
+        trading_hours = info['trading_hours']
+        assert trading_hours['open'] == '09:30'
+        assert trading_hours['close'] == '16:00'
+        
+        # Main US exchanges all support extended hours
+        assert 'extended_hours' in EXCHANGE_INFO[exchange]
     
     def test_canadian_exchanges(self):
         """Test Canadian exchange configurations."""
@@ -75,34 +116,19 @@ class TestMajorGlobalExchanges:
         assert mexi_info['currency'] == 'MXN'
         assert mexi_info['timezone'] == 'America/Mexico_City'
     
-    def test_asian_exchanges(self):
+    @pytest.mark.parametrize("exchange,country,currency,timezone", ASIAN_CONFIGS,
+                             ids=[config[0] for config in ASIAN_CONFIGS])
+    def test_asian_exchanges(self, exchange, country, currency, timezone):
         """Test Asian exchange configurations."""
-        # Test major Asian exchanges
-        asian_configs = [
-            ('TWSE', 'Taiwan', 'TWD', 'Asia/Taipei'),
-            ('SSE', 'China', 'CNY', 'Asia/Shanghai'),
-            ('SZSE', 'China', 'CNY', 'Asia/Shanghai'),
-            ('BSE', 'India', 'INR', 'Asia/Kolkata'),
-            ('NSE', 'India', 'INR', 'Asia/Kolkata'),
-            ('SGX', 'Singapore', 'SGD', 'Asia/Singapore'),
-            ('SET', 'Thailand', 'THB', 'Asia/Bangkok'),
-            ('IDX', 'Indonesia', 'IDR', 'Asia/Jakarta'),
-            ('KLSE', 'Malaysia', 'MYR', 'Asia/Kuala_Lumpur'),
-            ('NZX', 'New Zealand', 'NZD', 'Pacific/Auckland')
-        ]
-        
-        for exchange, country, currency, timezone in asian_configs:
-            info = exchange_manager.get_exchange_info(exchange)
-            assert info is not None
-            assert info['country'] == country
-            assert info['currency'] == currency
-            assert info['timezone'] == timezone
+        info = exchange_manager.get_exchange_info(exchange)
+        assert info is not None
+        assert info['country'] == country
+        assert info['currency'] == currency
+        assert info['timezone'] == timezone
     
     def test_lunch_break_exchanges(self):
         """Test exchanges with lunch breaks."""
-        lunch_break_exchanges = ['SSE', 'SZSE', 'SET', 'IDX', 'KLSE']
-        
-        for exchange in lunch_break_exchanges:
+        for exchange in LUNCH_BREAK:
             exchange_info = EXCHANGE_INFO[exchange]
             assert exchange_info.get('has_lunch_break') == True
             
@@ -141,8 +167,7 @@ class TestMajorGlobalExchanges:
     def test_special_settlement_periods(self):
         """Test exchanges with non-standard settlement periods."""
         # Chinese exchanges use T+1
-        chinese_exchanges = ['SSE', 'SZSE']
-        for exchange in chinese_exchanges:
+        for exchange in CHINESE:
             info = exchange_manager.get_exchange_info(exchange)
             assert info['settlement'] == 'T+1'
         
@@ -151,39 +176,17 @@ class TestMajorGlobalExchanges:
         assert jse_info['settlement'] == 'T+3'
         
         # Most others use T+2
-        t2_exchanges = ['NYSE', 'NASDAQ', 'TSX', 'B3', 'TWSE', 'BSE', 'NSE', 'SGX']
-        for exchange in t2_exchanges:
+        for exchange in T2_EXCHANGES:
             info = exchange_manager.get_exchange_info(exchange)
             assert info['settlement'] == 'T+2'
     
-    def test_currency_validation_all_exchanges(self):
+    @pytest.mark.parametrize("currency,exchange", CURRENCY_CASES)
+    def test_currency_validation_all_exchanges(self, currency, exchange):
         """Test currency validation for all new exchanges."""
-        currency_mappings = {
-            'USD': ['NYSE', 'NASDAQ', 'ARCA', 'BATS', 'IEX'],
-            'CAD': ['TSX', 'TSXV'],
-            'BRL': ['B3'],
-            'MXN': ['MEXI'],
-            'TWD': ['TWSE'],
-            'CNY': ['SSE', 'SZSE'],
-            'INR': ['BSE', 'NSE'],
-            'SGD': ['SGX'],
-            'THB': ['SET'],
-            'IDR': ['IDX'],
-            'MYR': ['KLSE'],
-            'NZD': ['NZX'],
-            'ILS': ['TASE'],
-            'SAR': ['TADAWUL'],
-            'EGP': ['EGX'],
-            'ZAR': ['JSE'],
-            'EUR': ['LSEETF', 'GETTEX', 'TRADEGATE']
-        }
-        
-        for currency, exchanges in currency_mappings.items():
-            for exchange in exchanges:
-                assert exchange_manager.validate_currency_for_exchange(exchange, currency)
-                # Test that wrong currency fails
-                wrong_currency = 'USD' if currency != 'USD' else 'EUR'
-                assert not exchange_manager.validate_currency_for_exchange(exchange, wrong_currency)
+        assert exchange_manager.validate_currency_for_exchange(exchange, currency)
+        # Test that wrong currency fails
+        wrong_currency = 'USD' if currency != 'USD' else 'EUR'
+        assert not exchange_manager.validate_currency_for_exchange(exchange, wrong_currency)
     
     def test_extended_hours_trading(self):
         """Test extended hours configurations."""
@@ -199,12 +202,17 @@ class TestMajorGlobalExchanges:
     
     def test_continuous_trading_exchanges(self):
         """Test exchanges with continuous trading."""
-        continuous_exchanges = ['GETTEX', 'TRADEGATE', 'IDEALPRO']
-        
-        for exchange in continuous_exchanges:
+        for exchange in CONTINUOUS:
             exchange_info = EXCHANGE_INFO[exchange]
             assert exchange_info.get('continuous_trading') == True
     
+    @pytest.mark.parametrize("exchange", list(EXCHANGE_INFO))
+    def test_exchange_info_json_serializable(self, exchange):
+        """Test exchange info responses serialize to JSON, including nested session hours."""
+        info = exchange_manager.get_exchange_info(exchange)
+        
+        assert json.loads(json.dumps(info))['trading_hours'] == info['trading_hours']
+    
     def test_total_exchange_count(self):
         """Test that we now have a comprehensive list of exchanges."""
         supported = exchange_manager.get_supported_exchanges()
@@ -213,12 +221,14 @@ class TestMajorGlobalExchanges:
         assert len(supported) >= 45, f"Expected at least 45 exchanges, got {len(supported)}"
         
         # Major regions should be represented
-        us_count = len([ex for ex in supported if exchange_manager.get_exchange_info(ex)['country'] == 'United States'])
-        assert us_count >= 5, "Should have multiple US exchanges"
+        us_exchanges = exchange_manager.get_exchanges_by_country('United States')
+        assert len(us_exchanges) >= 5, "Should have multiple US exchanges"
+        assert us_exchanges <= set(supported)
+        
+        asian_exchanges = frozenset().union(*map(exchange_manager.get_exchanges_by_country, ASIAN_COUNTRIES))
+        assert len(asian_exchanges) >= 10, "Should have substantial Asian coverage"
         
-        asian_count = len([ex for ex in supported if exchange_manager.get_exchange_info(ex)['country'] in 
-                          ['Japan', 'China', 'India', 'Singapore', 'Taiwan', 'Thailand', 'Indonesia', 'Malaysia']])
-        assert asian_count >= 10, "Should have substantial Asian coverage"
+        assert exchange_manager.get_exchanges_by_country('Atlantis') == frozenset()
     
     def test_market_status_all_exchanges(self):
         """Test that market status works for all exchanges."""
@@ -231,6 +241,24 @@ class TestMajorGlobalExchanges:
             assert exchange in status, f"Exchange {exchange} not in market status summary"
             assert isinstance(status[exchange], bool), f"Market status for {exchange} should be boolean"
 
+    
+    def test_market_status_summary_cached(self, monkeypatch):
+        """Test that back-to-back summaries reuse the cached status."""
+        from ibkr_mcp_server.data import exchange_info
+        
+        manager = exchange_info.ExchangeManager()
+        calls = []
+        monkeypatch.setattr(manager, 'is_market_open', lambda exchange, current_time=None: calls.append(exchange) or True)
+        # Pin the early-refresh draw so the second call always hits the cache
+        monkeypatch.setattr(exchange_info, 'random', lambda: 1.0)
+        
+        first = manager.get_market_status_summary()
+        first['NYSE'] = False
+        second = manager.get_market_status_summary()
+        
+        assert len(calls) == len(EXCHANGE_INFO)
+        assert second['NYSE'] is True, "Callers must not be able to mutate the cached summary"
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
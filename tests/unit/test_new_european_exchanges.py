@@ -4,109 +4,78 @@ import pytest
 from datetime import time
 from ibkr_mcp_server.data.exchange_info import exchange_manager, EXCHANGE_INFO
 
+# (code, name, country, currency, timezone) for each new European exchange
+EXPECTED_EXCHANGES = [
+    ('BIT', 'Borsa Italiana', 'Italy', 'EUR', 'Europe/Rome'),
+    ('MIL', 'Milan Stock Exchange', 'Italy', 'EUR', 'Europe/Rome'),
+    ('BME', 'Bolsas y Mercados Españoles', 'Spain', 'EUR', 'Europe/Madrid'),
+    ('BVME', 'Madrid Stock Exchange', 'Spain', 'EUR', 'Europe/Madrid'),
+    ('OSE', 'Oslo Stock Exchange', 'Norway', 'NOK', 'Europe/Oslo'),
+    ('OMX', 'Nasdaq Stockholm', 'Sweden', 'SEK', 'Europe/Stockholm'),
+    ('HEX', 'Nasdaq Helsinki', 'Finland', 'EUR', 'Europe/Helsinki'),
+    ('VIX', 'Vienna Stock Exchange', 'Austria', 'EUR', 'Europe/Vienna'),
+    ('WSE', 'Warsaw Stock Exchange', 'Poland', 'PLN', 'Europe/Warsaw'),
+    ('BEL', 'Euronext Brussels', 'Belgium', 'EUR', 'Europe/Brussels')
+]
+
+# (exchange, accepted currency, rejected currency)
+CURRENCY_CASES = [
+    ('BIT', 'EUR', 'USD'),
+    ('MIL', 'EUR', 'USD'),
+    ('BME', 'EUR', 'USD'),
+    ('BVME', 'EUR', 'USD'),
+    ('VIX', 'EUR', 'USD'),
+    ('BEL', 'EUR', 'USD'),
+    ('HEX', 'EUR', 'USD'),
+    ('OSE', 'NOK', 'EUR'),
+    ('OMX', 'SEK', 'EUR'),
+    ('WSE', 'PLN', 'EUR')
+]
+
+NEW_EXCHANGES = frozenset(['BIT', 'MIL', 'BME', 'BVME', 'VIX', 'BEL', 'OSE', 'OMX', 'HEX', 'WSE', 'IBIS2'])
+
+
+@pytest.fixture(scope="module")
+def exchange_info_cache():
+    """Exchange info for every new exchange, fetched once per module"""
+    return {code: exchange_manager.get_exchange_info(code) for code in NEW_EXCHANGES}
+
+
+@pytest.fixture(scope="module")
+def supported_cache():
+    """Supported exchange codes, fetched once per module"""
+    return exchange_manager.get_supported_exchanges()
+
+
+@pytest.fixture(scope="module")
+def status_cache():
+    """Market status summary, fetched once per module"""
+    return exchange_manager.get_market_status_summary()
+
 
 class TestNewEuropeanExchanges:
     """Test new European exchanges added to the system."""
     
     def test_new_exchanges_exist(self):
         """Test that all new European exchanges are properly defined."""
-        new_exchanges = ['BIT', 'MIL', 'BME', 'BVME', 'VIX', 'BEL', 'OSE', 'OMX', 'HEX', 'WSE', 'IBIS2']
-        
-        for exchange in new_exchanges:
-            assert exchange in EXCHANGE_INFO, f"Exchange {exchange} not found in EXCHANGE_INFO"
-    
-    def test_italian_exchanges(self):
-        """Test Italian exchange configurations."""
-        # Test BIT (Borsa Italiana)
-        bit_info = exchange_manager.get_exchange_info('BIT')
-        assert bit_info is not None
-        assert bit_info['name'] == 'Borsa Italiana'
-        assert bit_info['country'] == 'Italy'
-        assert bit_info['currency'] == 'EUR'
-        assert bit_info['timezone'] == 'Europe/Rome'
-        assert bit_info['settlement'] == 'T+2'
-        
-        # Test MIL (Milan Stock Exchange)
-        mil_info = exchange_manager.get_exchange_info('MIL')
-        assert mil_info is not None
-        assert mil_info['name'] == 'Milan Stock Exchange'
-        assert mil_info['country'] == 'Italy'
-        assert mil_info['currency'] == 'EUR'
+        missing = NEW_EXCHANGES - frozenset(EXCHANGE_INFO)
+        assert not missing, f"Exchanges not found in EXCHANGE_INFO: {sorted(missing)}"
     
-    def test_spanish_exchanges(self):
-        """Test Spanish exchange configurations."""
-        # Test BME
-        bme_info = exchange_manager.get_exchange_info('BME')
-        assert bme_info is not None
-        assert bme_info['name'] == 'Bolsas y Mercados Españoles'
-        assert bme_info['country'] == 'Spain'
-        assert bme_info['currency'] == 'EUR'
-        assert bme_info['timezone'] == 'Europe/Madrid'
-        
-        # Test BVME (Madrid Stock Exchange)
-        bvme_info = exchange_manager.get_exchange_info('BVME')
-        assert bvme_info is not None
-        assert bvme_info['name'] == 'Madrid Stock Exchange'
-        assert bvme_info['country'] == 'Spain'
-    
-    def test_nordic_exchanges(self):
-        """Test Nordic exchange configurations."""
-        # Test OSE (Oslo)
-        ose_info = exchange_manager.get_exchange_info('OSE')
-        assert ose_info is not None
-        assert ose_info['name'] == 'Oslo Stock Exchange'
-        assert ose_info['country'] == 'Norway'
-        assert ose_info['currency'] == 'NOK'
-        assert ose_info['timezone'] == 'Europe/Oslo'
-        
-        # Test OMX (Stockholm)
-        omx_info = exchange_manager.get_exchange_info('OMX')
-        assert omx_info is not None
-        assert omx_info['name'] == 'Nasdaq Stockholm'
-        assert omx_info['country'] == 'Sweden'
-        assert omx_info['currency'] == 'SEK'
-        
-        # Test HEX (Helsinki)
-        hex_info = exchange_manager.get_exchange_info('HEX')
-        assert hex_info is not None
-        assert hex_info['name'] == 'Nasdaq Helsinki'
-        assert hex_info['country'] == 'Finland'
-        assert hex_info['currency'] == 'EUR'
-        assert hex_info['timezone'] == 'Europe/Helsinki'
-    
-    def test_austrian_exchange(self):
-        """Test Austrian exchange configuration."""
-        vix_info = exchange_manager.get_exchange_info('VIX')
-        assert vix_info is not None
-        assert vix_info['name'] == 'Vienna Stock Exchange'
-        assert vix_info['country'] == 'Austria'
-        assert vix_info['currency'] == 'EUR'
-        assert vix_info['timezone'] == 'Europe/Vienna'
-    
-    def test_polish_exchange(self):
-        """Test Polish exchange configuration."""
-        wse_info = exchange_manager.get_exchange_info('WSE')
-        assert wse_info is not None
-        assert wse_info['name'] == 'Warsaw Stock Exchange'
-        assert wse_info['country'] == 'Poland'
-        assert wse_info['currency'] == 'PLN'
-        assert wse_info['timezone'] == 'Europe/Warsaw'
+    @pytest.mark.parametrize("code,name,country,currency,timezone", EXPECTED_EXCHANGES,
+                             ids=[row[0] for row in EXPECTED_EXCHANGES])
+    def test_exchange_config(self, exchange_info_cache, code, name, country, currency, timezone):
+        """Test new European exchange configurations."""
+        info = exchange_info_cache[code]
+        assert info is not None
+        assert info['name'] == name
+        assert info['country'] == country
+        assert info['currency'] == currency
+        assert info['timezone'] == timezone
+        assert info['settlement'] == 'T+2'
     
-    def test_belgian_exchange(self):
-        """Test Belgian exchange configuration."""
-        bel_info = exchange_manager.get_exchange_info('BEL')
-        assert bel_info is not None
-        assert bel_info['name'] == 'Euronext Brussels'
-        assert bel_info['country'] == 'Belgium'
-        assert bel_info['currency'] == 'EUR'
-        assert bel_info['timezone'] == 'Europe/Brussels'
-    
-    def test_trading_hours_format(self):
+    def test_trading_hours_format(self, exchange_info_cache):
         """Test that trading hours are properly serialized."""
-        new_exchanges = ['BIT', 'BME', 'OSE', 'OMX', 'HEX', 'WSE', 'VIX', 'BEL']
-        
-        for exchange in new_exchanges:
-            info = exchange_manager.get_exchange_info(exchange)
+        for exchange, info in exchange_info_cache.items():
             assert 'trading_hours' in info
             
             # Check that times are converted to strings
@@ -115,60 +84,39 @@ class TestNewEuropeanExchanges:
                 assert isinstance(value, str), f"Trading hour {key} for {exchange} should be string, got {type(value)}"
                 assert ':' in value, f"Trading hour {key} for {exchange} should be in HH:MM format"
     
-    def test_currency_validation(self):
+    @pytest.mark.parametrize("exchange,good_currency,bad_currency", CURRENCY_CASES,
+                             ids=[case[0] for case in CURRENCY_CASES])
+    def test_currency_validation(self, exchange, good_currency, bad_currency):
         """Test currency validation for new exchanges."""
-        # Test Euro exchanges
-        euro_exchanges = ['BIT', 'MIL', 'BME', 'BVME', 'VIX', 'BEL', 'HEX']
-        for exchange in euro_exchanges:
-            assert exchange_manager.validate_currency_for_exchange(exchange, 'EUR')
-            assert not exchange_manager.validate_currency_for_exchange(exchange, 'USD')
-        
-        # Test NOK exchange
-        assert exchange_manager.validate_currency_for_exchange('OSE', 'NOK')
-        assert not exchange_manager.validate_currency_for_exchange('OSE', 'EUR')
-        
-        # Test SEK exchange
-        assert exchange_manager.validate_currency_for_exchange('OMX', 'SEK')
-        assert not exchange_manager.validate_currency_for_exchange('OMX', 'EUR')
-        
-        # Test PLN exchange
-        assert exchange_manager.validate_currency_for_exchange('WSE', 'PLN')
-        assert not exchange_manager.validate_currency_for_exchange('WSE', 'EUR')
+        assert exchange_manager.validate_currency_for_exchange(exchange, good_currency)
+        assert not exchange_manager.validate_currency_for_exchange(exchange, bad_currency)
     
-    def test_supported_exchanges_list(self):
+    def test_supported_exchanges_list(self, supported_cache):
         """Test that new exchanges appear in supported exchanges list."""
-        supported = exchange_manager.get_supported_exchanges()
-        new_exchanges = ['BIT', 'MIL', 'BME', 'BVME', 'VIX', 'BEL', 'OSE', 'OMX', 'HEX', 'WSE', 'IBIS2']
-        
-        for exchange in new_exchanges:
-            assert exchange in supported, f"Exchange {exchange} not in supported exchanges list"
+        missing = NEW_EXCHANGES - frozenset(supported_cache)
+        assert not missing, f"Exchanges not in supported exchanges list: {sorted(missing)}"
     
-    def test_market_status_includes_new_exchanges(self):
+    def test_market_status_includes_new_exchanges(self, status_cache):
         """Test that market status summary includes new exchanges."""
-        status = exchange_manager.get_market_status_summary()
-        new_exchanges = ['BIT', 'MIL', 'BME', 'BVME', 'VIX', 'BEL', 'OSE', 'OMX', 'HEX', 'WSE', 'IBIS2']
+        missing = NEW_EXCHANGES - frozenset(status_cache)
+        assert not missing, f"Exchanges not in market status summary: {sorted(missing)}"
         
-        for exchange in new_exchanges:
-            assert exchange in status, f"Exchange {exchange} not in market status summary"
-            assert isinstance(status[exchange], bool), f"Market status for {exchange} should be boolean"
+        for exchange in NEW_EXCHANGES:
+            assert isinstance(status_cache[exchange], bool), f"Market status for {exchange} should be boolean"
 
 
+@pytest.mark.skip(reason="Stock mapping checks not implemented yet")
 class TestInternationalStockMapping:
     """Test new stock mappings in international.py."""
     
     def test_italian_stock_mapping(self):
         """Test Italian stock mappings."""
-        # This would require importing the actual mapping function
-        # For now, just verify the structure exists
-        pass
     
     def test_spanish_stock_mapping(self):
         """Test Spanish stock mappings."""
-        pass
     
     def test_nordic_stock_mapping(self):
         """Test Nordic stock mappings."""
-        pass
 
 
 if __name__ == "__main__":
@@ -13,105 +13,176 @@ All tests use mocked IBKR API to avoid external dependencies.
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock, patch
-from datetime import datetime, timezone
-from typing import Dict, Any
+import itertools
+from types import MappingProxyType
+from unittest.mock import Mock, patch
+from dataclasses import astuple, dataclass, field
+from typing import Optional
 
 from ibkr_mcp_server.trading.order_management import OrderManager
-from ibkr_mcp_server.utils import ValidationError, ConnectionError
-from ib_async import IB, Stock, Order, Trade, MarketOrder, LimitOrder, StopOrder
+from ibkr_mcp_server.utils import ConnectionError
+from ib_async import IB, Stock, Forex
 
 
 @pytest.fixture
-def enabled_trading_settings():
-    """Fixture to enable trading in enhanced_validators"""
-    with patch('ibkr_mcp_server.enhanced_validators.enhanced_settings') as mock_settings:
-        mock_settings.enable_trading = True
-        mock_settings.enable_stop_loss_orders = True
-        mock_settings.ibkr_is_paper = True
-        mock_settings.max_order_size = 1000
-        mock_settings.max_order_value_usd = 50000.0  # Increased for tests
-        mock_settings.max_stop_loss_orders = 25
-        mock_settings.max_trail_percent = 25.0
-        mock_settings.supported_forex_pairs = ["EURUSD", "GBPUSD", "USDJPY"]
-        mock_settings.supported_currencies = ["USD", "EUR", "GBP", "JPY", "CHF", "AUD", "CAD"]
-        mock_settings.allowed_account_prefixes = ["DU", "DUH"]
-        yield mock_settings
+def order_manager(mock_ib, enabled_trading_settings):
+    """Create OrderManager with mocked IB client and enhanced settings."""
+    manager = OrderManager(mock_ib)
+    return manager
 
 
 @pytest.fixture
-def mock_ib():
-    """Mock IB client with common order methods."""
-    ib = Mock(spec=IB)
-    ib.isConnected = Mock(return_value=True)
-    ib.qualifyContractsAsync = AsyncMock()
-    ib.placeOrder = Mock()
-    ib.cancelOrder = Mock()
-    ib.reqOpenOrdersAsync = AsyncMock(return_value=[])
-    # Add client mock with getReqId method
-    ib.client = Mock()
-    ib.client.getReqId = Mock(return_value=12345)
-    return ib
+def fast_order_manager(order_manager):
+    """OrderManager that skips the connection check, for success-path tests."""
+    order_manager._ensure_connected = lambda: None
+    return order_manager
 
 
-@pytest.fixture
-def enabled_trading_settings():
-    """Fixture to enable trading in enhanced_validators"""
-    with patch('ibkr_mcp_server.enhanced_validators.enhanced_settings') as mock_settings:
-        mock_settings.enable_trading = True
-        mock_settings.enable_forex_trading = True
-        mock_settings.enable_international_trading = True
-        mock_settings.enable_stop_loss_orders = True
-        mock_settings.ibkr_is_paper = True
-        mock_settings.max_order_size = 1000  # Allow large test orders
-        mock_settings.max_order_value_usd = 100000.0  # Allow large test values
-        mock_settings.max_daily_orders = 1000  # Allow many test orders
-        mock_settings.max_stop_loss_orders = 100  # Allow many test stop losses
-        mock_settings.supported_forex_pairs = ["EURUSD", "GBPUSD", "USDJPY"]
-        mock_settings.supported_currencies = ["USD", "EUR", "GBP", "JPY", "CHF", "AUD", "CAD"]
-        mock_settings.allowed_account_prefixes = ["DU", "DUH"]
-        yield mock_settings
+@pytest.fixture(scope="module")
+def shared_mock_ib():
+    """Bare IB mock for tests that never configure or inspect IB calls."""
+    return Mock(spec=IB)
 
 
-@pytest.fixture
-def order_manager(mock_ib, enabled_trading_settings):
-    """Create OrderManager with mocked IB client and enhanced settings."""
-    manager = OrderManager(mock_ib)
-    return manager
+@pytest.fixture(scope="module")
+def shared_order_manager(shared_mock_ib, enabled_trading_settings):
+    """OrderManager built once per module for tests that only read it or touch tracking."""
+    return OrderManager(shared_mock_ib)
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset(shared_order_manager):
+    """Clear the shared manager's order tracking after each test."""
+    yield
+    shared_order_manager.active_orders.clear()
+    shared_order_manager.bracket_orders.clear()
+
+
+@pytest.fixture(scope="module")
 def sample_stock_contract():
-    """Sample stock contract for testing."""
+    """Sample stock contract for testing; read-only, so built once per module."""
     contract = Stock("AAPL", "SMART", "USD")
     contract.conId = 265598  # Apple's contract ID
-    return contract
+    # Field-by-field snapshot; Contract equality only compares conId
+    snapshot = astuple(contract)
+    yield contract
+    
+    # Shared across the module, so any test writing to it would leak into the rest
+    assert astuple(contract) == snapshot, "a test mutated the shared sample_stock_contract"
+
+
+@dataclass(slots=True)
+class _Order:
+    """Order fields OrderManager reads from an IBKR trade."""
+    orderId: int = 12345
+    action: str = "BUY"
+    totalQuantity: int = 100
+    orderType: str = "MKT"
+    lmtPrice: Optional[float] = None
+    tif: str = "DAY"
+
+
+@dataclass(slots=True)
+class _OrderStatus:
+    status: str = "Submitted"
+
+
+@dataclass(slots=True)
+class _Contract:
+    symbol: str = "AAPL"
+
+
+@dataclass(slots=True)
+class _Trade:
+    order: _Order = field(default_factory=_Order)
+    orderStatus: _OrderStatus = field(default_factory=_OrderStatus)
+    contract: _Contract = field(default_factory=_Contract)
 
 
 @pytest.fixture
 def sample_trade():
     """Sample trade object for testing."""
-    trade = Mock(spec=Trade)
-    trade.order = Mock(spec=Order)
-    trade.order.orderId = 12345
-    trade.order.action = "BUY"
-    trade.order.totalQuantity = 100
-    trade.order.orderType = "MKT"
-    trade.orderStatus = Mock()
-    trade.contract = Mock()
-    trade.contract.symbol = "AAPL"
-    trade.orderStatus.status = "Submitted"
-    return trade
+    return _Trade()
+
+
+def _async_return(value):
+    """Plain coroutine stub returning value; cheaper than AsyncMock when no call asserts are needed"""
+    async def _stub(*args, **kwargs):
+        return value
+    
+    return _stub
+
+
+def _order_fields(order, *names):
+    """Selected order attributes as a dict, so one assert shows every mismatch."""
+    return {name: getattr(order, name) for name in names}
+
+
+def _assert_keys(d, required):
+    """Assert every required key is present, reporting all missing keys at once."""
+    missing = required - d.keys()
+    assert not missing, f"missing: {missing}"
+
+
+# Tracked orders across active and completed statuses, copied into a manager per test
+_SEEDED_ORDERS = MappingProxyType({
+    12345: MappingProxyType({'order_id': 12345, 'symbol': 'AAPL', 'status': 'Submitted'}),
+    12346: MappingProxyType({'order_id': 12346, 'symbol': 'MSFT', 'status': 'Working'}),
+    12347: MappingProxyType({'order_id': 12347, 'symbol': 'GOOGL', 'status': 'Filled'}),
+    12348: MappingProxyType({'order_id': 12348, 'symbol': 'TSLA', 'status': 'Cancelled'}),
+})
+
+
+# Expected contracts for _create_contract, built once at import
+_EXPECTED_STOCK = Stock("AAPL", "SMART", "USD")
+_EXPECTED_FOREX = Forex("EURUSD")
+
+
+def _contract_shape(contract):
+    """Fields identifying a contract, for comparing against the expected sentinels."""
+    return (contract.secType, contract.symbol, contract.exchange, contract.currency)
+
+
+@pytest.fixture
+def make_tracked_order():
+    """Factory for active_orders entries; keyword overrides replace the defaults."""
+    def _make(order_id, **overrides):
+        # AAPL DAY limit order, built per entry so tests can change it freely
+        order = _Order(orderId=order_id, orderType="LMT", lmtPrice=150.0)
+        return {
+            'order_id': order_id,
+            'symbol': 'AAPL',
+            'order': order,
+            'status': 'Submitted',
+            **overrides
+        }
+    
+    return _make
+
+
+@pytest.fixture
+def modifiable_order(order_manager, mock_ib, sample_stock_contract, make_tracked_order):
+    """Working AAPL limit order tracked by order_manager, returned as (order_id, order_manager)."""
+    order_id = 12345
+    order_manager.active_orders[order_id] = make_tracked_order(order_id, contract=sample_stock_contract)
+    original_order = order_manager.active_orders[order_id]['order']
+    
+    # Mock placeOrder for modification
+    modified_trade = Mock()
+    modified_trade.order = original_order
+    mock_ib.placeOrder.return_value = modified_trade
+    
+    return order_id, order_manager
 
 
 class TestOrderManagerInitialization:
     """Test OrderManager initialization and basic functionality."""
     
-    def test_order_manager_initialization(self, mock_ib):
+    def test_order_manager_initialization(self, shared_order_manager, shared_mock_ib):
         """Test OrderManager initializes correctly."""
-        manager = OrderManager(mock_ib)
+        manager = shared_order_manager
         
-        assert manager.ib == mock_ib
+        assert manager.ib == shared_mock_ib
         assert hasattr(manager, 'validator')
         assert hasattr(manager, 'active_orders')
         assert hasattr(manager, 'bracket_orders')
@@ -129,16 +200,15 @@ class TestOrderManagerInitialization:
         with pytest.raises(ConnectionError):
             order_manager._ensure_connected()
     
-    def test_contract_creation(self, order_manager):
+    def test_contract_creation(self, shared_order_manager):
         """Test contract creation for different asset types."""
         # Test stock contract
-        stock_contract = order_manager._create_contract("AAPL", "SMART", "USD")
-        assert stock_contract.symbol == "AAPL"
-        assert stock_contract.exchange == "SMART"
-        assert stock_contract.currency == "USD"
+        stock_contract = shared_order_manager._create_contract("AAPL", "SMART", "USD")
+        assert _contract_shape(stock_contract) == _contract_shape(_EXPECTED_STOCK)
         
         # Test forex contract (IBKR Forex expects pair format like EURUSD)
-        forex_contract = order_manager._create_contract("EURUSD", "IDEALPRO", "USD")
+        forex_contract = shared_order_manager._create_contract("EURUSD", "IDEALPRO", "USD")
+        assert _contract_shape(forex_contract) == _contract_shape(_EXPECTED_FOREX)
         assert forex_contract.symbol == "EUR"  # Base currency
         assert forex_contract.currency == "USD"  # Quote currency
 
@@ -146,15 +216,15 @@ class TestOrderManagerInitialization:
 class TestMarketOrderPlacement:
     """Test market order placement functionality."""
     
-    @pytest.mark.asyncio
-    async def test_place_market_order_success(self, order_manager, mock_ib, sample_stock_contract, sample_trade):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_place_market_order_success(self, fast_order_manager, mock_ib, sample_stock_contract, sample_trade):
         """Test successful market order placement."""
         # Setup mocks
-        mock_ib.qualifyContractsAsync.return_value = [sample_stock_contract]
+        mock_ib.qualifyContractsAsync = _async_return([sample_stock_contract])
         mock_ib.placeOrder.return_value = sample_trade
         
         # Place market order
-        result = await order_manager.place_market_order(
+        result = await fast_order_manager.place_market_order(
             symbol="AAPL",
             action="BUY", 
             quantity=100
@@ -168,39 +238,21 @@ class TestMarketOrderPlacement:
         assert result['quantity'] == 100
         assert result['order_type'] == "MKT"
         assert result['status'] == "Submitted"
-        assert 'timestamp' in result
+        _assert_keys(result, {"success", "order_id", "symbol", "timestamp"})
         
         # Verify order is tracked
-        assert 12345 in order_manager.active_orders
-        order_info = order_manager.active_orders[12345]
+        assert 12345 in fast_order_manager.active_orders
+        order_info = fast_order_manager.active_orders[12345]
         assert order_info['symbol'] == "AAPL"
         assert order_info['status'] == "Submitted"
     
-    @pytest.mark.asyncio
-    async def test_place_market_order_invalid_parameters(self, order_manager):
-        """Test market order with invalid parameters."""
-        # Test invalid action
-        result = await order_manager.place_market_order(
-            symbol="AAPL",
-            action="INVALID",
-            quantity=100
-        )
-        assert result['success'] == False
-        assert 'error' in result
-        
-        # Test negative quantity
-        result = await order_manager.place_market_order(
-            symbol="AAPL", 
-            action="BUY",
-            quantity=-100
-        )
-        assert result['success'] == False
-        assert 'error' in result
-    
-    @pytest.mark.asyncio
-    async def test_place_market_order_connection_error(self, order_manager, mock_ib):
-        """Test market order placement when disconnected."""
-        mock_ib.isConnected.return_value = False
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("connected,ok", [(True, True), (False, False)], ids=["connected", "disconnected"])
+    async def test_connectivity(self, order_manager, mock_ib, sample_stock_contract, sample_trade, connected, ok):
+        """Test market order placement succeeds only while connected."""
+        mock_ib.isConnected.return_value = connected
+        mock_ib.qualifyContractsAsync = _async_return([sample_stock_contract])
+        mock_ib.placeOrder.return_value = sample_trade
         
         result = await order_manager.place_market_order(
             symbol="AAPL",
@@ -208,32 +260,34 @@ class TestMarketOrderPlacement:
             quantity=100
         )
         
-        assert result['success'] == False
-        assert 'error' in result
-        assert 'connected' in result['error'].lower()  # Changed from 'connection' to match actual error message
+        assert result['success'] == ok
+        if not ok:
+            _assert_keys(result, {"success", "error"})
+            assert 'connected' in result['error'].lower()  # Changed from 'connection' to match actual error message
 
 
 class TestLimitOrderPlacement:
     """Test limit order placement functionality."""
     
-    @pytest.mark.asyncio
-    async def test_place_limit_order_success(self, order_manager, mock_ib, sample_stock_contract, sample_trade):
-        """Test successful limit order placement."""
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("tif", ["DAY", "GTC", "IOC", "FOK"])
+    async def test_place_limit_order(self, fast_order_manager, mock_ib, sample_stock_contract, sample_trade, tif):
+        """Test successful limit order placement for each time-in-force value."""
         # Setup mocks
         sample_trade.order.orderType = "LMT"
         sample_trade.order.lmtPrice = 150.0
-        sample_trade.order.tif = "DAY"
+        sample_trade.order.tif = tif
         
-        mock_ib.qualifyContractsAsync.return_value = [sample_stock_contract]
+        mock_ib.qualifyContractsAsync = _async_return([sample_stock_contract])
         mock_ib.placeOrder.return_value = sample_trade
         
         # Place limit order
-        result = await order_manager.place_limit_order(
+        result = await fast_order_manager.place_limit_order(
             symbol="AAPL",
             action="BUY",
             quantity=100,
             price=150.0,
-            time_in_force="DAY"
+            time_in_force=tif
         )
         
         # Verify result
@@ -244,42 +298,19 @@ class TestLimitOrderPlacement:
         assert result['quantity'] == 100
         assert result['price'] == 150.0
         assert result['order_type'] == "LMT"
-        assert result['time_in_force'] == "DAY"
+        assert result['time_in_force'] == tif
         assert result['status'] == "Submitted"
-    
-    @pytest.mark.asyncio
-    async def test_place_limit_order_different_tif(self, order_manager, mock_ib, sample_stock_contract, sample_trade):
-        """Test limit order with different time-in-force values."""
-        mock_ib.qualifyContractsAsync.return_value = [sample_stock_contract]
-        mock_ib.placeOrder.return_value = sample_trade
-        
-        # Test GTC order
-        result = await order_manager.place_limit_order(
-            symbol="AAPL",
-            action="BUY",
-            quantity=100,
-            price=150.0,
-            time_in_force="GTC"
-        )
-        
-        assert result['success'] == True
-        assert result['time_in_force'] == "GTC"
 
 
 class TestOrderCancellation:
     """Test order cancellation functionality."""
     
-    @pytest.mark.asyncio
-    async def test_cancel_order_success(self, order_manager, mock_ib, sample_trade):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_cancel_order_success(self, order_manager, mock_ib, sample_trade, make_tracked_order):
         """Test successful order cancellation."""
         # Add order to tracking first
         order_id = 12345
-        order_manager.active_orders[order_id] = {
-            'order_id': order_id,
-            'symbol': 'AAPL',
-            'status': 'Submitted',
-            'trade': sample_trade
-        }
+        order_manager.active_orders[order_id] = make_tracked_order(order_id, trade=sample_trade)
         
         # Cancel order
         result = await order_manager.cancel_order(order_id)
@@ -288,12 +319,12 @@ class TestOrderCancellation:
         assert result['success'] == True
         assert result['order_id'] == order_id
         assert result['status'] == 'Cancelled'
-        assert 'timestamp' in result
+        _assert_keys(result, {"success", "order_id", "status", "timestamp"})
         
         # Verify order removed from tracking
         assert order_id not in order_manager.active_orders
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_cancel_order_not_found(self, order_manager, mock_ib):
         """Test cancelling non-existent order."""
         mock_ib.reqOpenOrdersAsync.return_value = []
@@ -301,10 +332,10 @@ class TestOrderCancellation:
         result = await order_manager.cancel_order(99999)
         
         assert result['success'] == False
-        assert 'error' in result
+        _assert_keys(result, {"success", "error"})
         assert 'not found' in result['error'].lower()
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_cancel_order_found_in_open_orders(self, order_manager, mock_ib, sample_trade):
         """Test cancelling order found in IBKR open orders."""
         sample_trade.order.orderId = 12345
@@ -320,145 +351,84 @@ class TestOrderCancellation:
 class TestOrderModification:
     """Test order modification functionality."""
     
-    @pytest.mark.asyncio
-    async def test_modify_order_quantity(self, order_manager, mock_ib, sample_stock_contract):
-        """Test modifying order quantity."""
-        # Setup existing order
-        order_id = 12345
-        original_order = Mock()
-        original_order.orderId = order_id
-        original_order.action = "BUY"
-        original_order.totalQuantity = 100
-        original_order.orderType = "LMT"
-        original_order.lmtPrice = 150.0
-        original_order.tif = "DAY"
-        
-        order_manager.active_orders[order_id] = {
-            'order_id': order_id,
-            'symbol': 'AAPL',
-            'order': original_order,
-            'contract': sample_stock_contract,
-            'status': 'Submitted'
-        }
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("kwargs", [
+        {"quantity": 150},
+        {"price": 155.0},
+        {"quantity": 200, "price": 160.0},
+    ], ids=["quantity", "price", "quantity_and_price"])
+    async def test_modify_order(self, modifiable_order, kwargs):
+        """Test modifying order quantity and/or price."""
+        order_id, order_manager = modifiable_order
         
-        # Mock placeOrder for modification
-        modified_trade = Mock()
-        modified_trade.order = original_order
-        mock_ib.placeOrder.return_value = modified_trade
-        
-        # Modify quantity
-        result = await order_manager.modify_order(order_id, quantity=150)
+        result = await order_manager.modify_order(order_id, **kwargs)
         
         # Verify result
         assert result['success'] == True
         assert result['order_id'] == order_id
         assert result['status'] == 'Modified'
-        assert 'modifications' in result
-        assert result['modifications']['quantity'] == 150
+        for key, value in kwargs.items():
+            assert result['modifications'][key] == value
     
-    @pytest.mark.asyncio
-    async def test_modify_order_price(self, order_manager, mock_ib, sample_stock_contract):
-        """Test modifying order price."""
-        # Setup existing limit order
-        order_id = 12345
-        original_order = Mock()
-        original_order.orderId = order_id
-        original_order.action = "BUY"
-        original_order.totalQuantity = 100
-        original_order.orderType = "LMT"
-        original_order.lmtPrice = 150.0
-        original_order.tif = "DAY"
-        
-        order_manager.active_orders[order_id] = {
-            'order_id': order_id,
-            'symbol': 'AAPL',
-            'order': original_order,
-            'contract': sample_stock_contract,
-            'status': 'Submitted'
-        }
-        
-        modified_trade = Mock()
-        modified_trade.order = original_order
-        mock_ib.placeOrder.return_value = modified_trade
-        
-        # Modify price
-        result = await order_manager.modify_order(order_id, price=155.0)
-        
-        assert result['success'] == True
-        assert result['modifications']['price'] == 155.0
-    
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_modify_order_not_found(self, order_manager):
         """Test modifying non-existent order."""
         result = await order_manager.modify_order(99999, quantity=150)
         
         assert result['success'] == False
-        assert 'error' in result
+        _assert_keys(result, {"success", "error"})
         assert 'not found' in result['error'].lower()
 
 
 class TestOrderStatus:
     """Test order status tracking functionality."""
     
-    @pytest.mark.asyncio
-    async def test_get_order_status_tracked_order(self, order_manager):
-        """Test getting status of tracked order."""
-        # Add order to tracking
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("source,expected_status", [
+        ("tracked", "Submitted"),
+        ("ibkr", "Working"),
+        ("missing", None),
+    ])
+    async def test_get_order_status(self, order_manager, mock_ib, sample_trade, make_tracked_order,
+                                    source, expected_status):
+        """Test order status from local tracking, from IBKR open orders, and when not found."""
         order_id = 12345
-        order_manager.active_orders[order_id] = {
-            'order_id': order_id,
-            'symbol': 'AAPL',
-            'exchange': 'SMART',
-            'currency': 'USD',
-            'order': Mock(action="BUY", totalQuantity=100, orderType="MKT"),
-            'status': 'Submitted',
-            'timestamp': '2024-01-15T14:30:00Z',
-            'fills': []
-        }
-        
-        result = await order_manager.get_order_status(order_id)
-        
-        assert result['success'] == True
-        assert result['order_id'] == order_id
-        assert result['symbol'] == 'AAPL'
-        assert result['status'] == 'Submitted'
-    
-    @pytest.mark.asyncio
-    async def test_get_order_status_from_ibkr(self, order_manager, mock_ib, sample_trade):
-        """Test getting status from IBKR when not tracked locally."""
-        sample_trade.order.orderId = 12345
-        sample_trade.contract.symbol = "AAPL"
-        sample_trade.orderStatus.status = "Working"
-        
-        mock_ib.reqOpenOrdersAsync.return_value = [sample_trade]
-        
-        result = await order_manager.get_order_status(12345)
-        
-        assert result['success'] == True
-        assert result['order_id'] == 12345
-        assert result['symbol'] == "AAPL"
-        assert result['status'] == "Working"
-    
-    @pytest.mark.asyncio
-    async def test_get_order_status_not_found(self, order_manager, mock_ib):
-        """Test getting status of non-existent order."""
         mock_ib.reqOpenOrdersAsync.return_value = []
         
-        result = await order_manager.get_order_status(99999)
+        if source == "tracked":
+            order_manager.active_orders[order_id] = make_tracked_order(
+                order_id,
+                exchange='SMART',
+                currency='USD',
+                timestamp='2024-01-15T14:30:00Z',
+                fills=[]
+            )
+        elif source == "ibkr":
+            # Not tracked locally, so the manager falls back to IBKR open orders
+            sample_trade.orderStatus.status = "Working"
+            mock_ib.reqOpenOrdersAsync.return_value = [sample_trade]
         
-        assert result['success'] == False
-        assert 'error' in result
-        assert 'not found' in result['error'].lower()
+        result = await order_manager.get_order_status(order_id)
+        
+        if expected_status is None:
+            assert result['success'] == False
+            _assert_keys(result, {"success", "error"})
+            assert 'not found' in result['error'].lower()
+        else:
+            assert result['success'] == True
+            assert result['order_id'] == order_id
+            assert result['symbol'] == 'AAPL'
+            assert result['status'] == expected_status
 
 
 class TestBracketOrders:
     """Test bracket order functionality."""
     
-    @pytest.mark.asyncio
-    async def test_place_bracket_order_success(self, order_manager, mock_ib, sample_stock_contract):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_place_bracket_order_success(self, fast_order_manager, mock_ib, sample_stock_contract):
         """Test successful bracket order placement."""
         # Mock bracket order creation
-        with patch.object(order_manager, '_create_bracket_orders') as mock_create:
+        with patch.object(fast_order_manager, '_create_bracket_orders') as mock_create:
             parent_order = Mock()
             parent_order.orderId = 12345
             stop_order = Mock()
@@ -476,11 +446,11 @@ class TestBracketOrders:
             target_trade = Mock()
             target_trade.order = target_order
             
-            mock_ib.qualifyContractsAsync.return_value = [sample_stock_contract]
+            mock_ib.qualifyContractsAsync = _async_return([sample_stock_contract])
             mock_ib.placeOrder.side_effect = [parent_trade, stop_trade, target_trade]
             
             # Place bracket order
-            result = await order_manager.place_bracket_order(
+            result = await fast_order_manager.place_bracket_order(
                 symbol="AAPL",
                 action="BUY",
                 quantity=100,
@@ -502,10 +472,14 @@ class TestBracketOrders:
             assert result['target_price'] == 160.0
             
             # Verify bracket tracking
-            assert 12345 in order_manager.bracket_orders
-            bracket_info = order_manager.bracket_orders[12345]
+            assert 12345 in fast_order_manager.bracket_orders
+            bracket_info = fast_order_manager.bracket_orders[12345]
             assert bracket_info['stop_order_id'] == 12346
             assert bracket_info['target_order_id'] == 12347
+            
+            # Legs go out parent first; the target's transmit flag releases the bracket
+            placed = [call.args[1] for call in mock_ib.placeOrder.call_args_list]
+            assert placed == [parent_order, stop_order, target_order]
     
     def test_create_bracket_orders(self, order_manager, mock_ib):
         """Test bracket order creation logic."""
@@ -521,52 +495,43 @@ class TestBracketOrders:
         )
         
         # Verify parent order
-        assert parent_order.action == "BUY"
-        assert parent_order.totalQuantity == 100
-        assert parent_order.lmtPrice == 150.0
-        assert parent_order.transmit == False
-        
-        # Verify stop order
-        assert stop_order.action == "SELL"  # Opposite of parent
-        assert stop_order.totalQuantity == 100
-        assert stop_order.auxPrice == 145.0
-        assert stop_order.parentId == 12345
-        assert stop_order.transmit == False
-        
-        # Verify target order
-        assert target_order.action == "SELL"  # Opposite of parent
-        assert target_order.totalQuantity == 100
-        assert target_order.lmtPrice == 160.0
-        assert target_order.parentId == 12345
-        assert target_order.transmit == True
+        assert _order_fields(parent_order, "action", "totalQuantity", "lmtPrice", "transmit") == {
+            "action": "BUY", "totalQuantity": 100, "lmtPrice": 150.0, "transmit": False
+        }
+        
+        # Verify stop order (opposite side of parent, held until target transmits)
+        assert _order_fields(stop_order, "action", "totalQuantity", "auxPrice", "parentId", "transmit") == {
+            "action": "SELL", "totalQuantity": 100, "auxPrice": 145.0, "parentId": 12345, "transmit": False
+        }
+        
+        # Verify target order (opposite side of parent, transmits the bracket)
+        assert _order_fields(target_order, "action", "totalQuantity", "lmtPrice", "parentId", "transmit") == {
+            "action": "SELL", "totalQuantity": 100, "lmtPrice": 160.0, "parentId": 12345, "transmit": True
+        }
 
 
 class TestOrderManagerUtilities:
     """Test utility methods and order tracking."""
     
-    def test_get_active_orders(self, order_manager):
+    @pytest.fixture
+    def order_manager(self, shared_order_manager):
+        """Module-shared OrderManager; utility methods never touch the IB client."""
+        return shared_order_manager
+    
+    @pytest.fixture
+    def seeded_order_manager(self, order_manager):
+        """Class manager tracking the canned _SEEDED_ORDERS set."""
+        order_manager.active_orders.update(_SEEDED_ORDERS)
+        return order_manager
+    
+    def test_get_active_orders(self, seeded_order_manager):
         """Test getting all active orders."""
-        # Add sample orders
-        order_manager.active_orders[12345] = {
-            'order_id': 12345,
-            'symbol': 'AAPL',
-            'order': Mock(action="BUY", totalQuantity=100),
-            'status': 'Submitted'
-        }
-        order_manager.active_orders[12346] = {
-            'order_id': 12346,
-            'symbol': 'MSFT',
-            'order': Mock(action="SELL", totalQuantity=50),
-            'status': 'Working'
-        }
+        active_orders = seeded_order_manager.get_active_orders()
         
-        active_orders = order_manager.get_active_orders()
-        
-        assert len(active_orders) == 2
-        assert 12345 in active_orders
-        assert 12346 in active_orders
+        assert set(active_orders) == set(_SEEDED_ORDERS)
         assert active_orders[12345]['symbol'] == 'AAPL'
         assert active_orders[12346]['symbol'] == 'MSFT'
+        assert active_orders[12346]['status'] == 'Working'
     
     def test_get_bracket_orders(self, order_manager):
         """Test getting all bracket orders."""
@@ -586,53 +551,22 @@ class TestOrderManagerUtilities:
         assert bracket_orders[12345]['symbol'] == 'AAPL'
         assert bracket_orders[12345]['stop_order_id'] == 12346
     
-    def test_cleanup_completed_orders(self, order_manager):
+    def test_cleanup_completed_orders(self, seeded_order_manager):
         """Test cleanup of completed orders."""
-        # Add orders with different statuses
-        order_manager.active_orders[12345] = {
-            'order_id': 12345,
-            'symbol': 'AAPL',
-            'status': 'Filled'  # Completed
-        }
-        order_manager.active_orders[12346] = {
-            'order_id': 12346, 
-            'symbol': 'MSFT',
-            'status': 'Working'  # Active
-        }
-        order_manager.active_orders[12347] = {
-            'order_id': 12347,
-            'symbol': 'GOOGL', 
-            'status': 'Cancelled'  # Completed
-        }
+        seeded_order_manager.cleanup_completed_orders()
         
-        # Cleanup
-        order_manager.cleanup_completed_orders()
-        
-        # Verify only active orders remain
-        assert len(order_manager.active_orders) == 1
-        assert 12346 in order_manager.active_orders
-        assert 12345 not in order_manager.active_orders
-        assert 12347 not in order_manager.active_orders
+        # Verify only the Submitted and Working orders remain
+        assert set(seeded_order_manager.active_orders) == {12345, 12346}
     
-    def test_format_order_info(self, order_manager):
+    def test_format_order_info(self, order_manager, make_tracked_order):
         """Test order information formatting."""
-        order = Mock()
-        order.action = "BUY"
-        order.totalQuantity = 100
-        order.orderType = "LMT"
-        order.lmtPrice = 150.0
-        order.tif = "DAY"
-        
-        order_info = {
-            'order_id': 12345,
-            'symbol': 'AAPL',
-            'exchange': 'SMART',
-            'currency': 'USD',
-            'order': order,
-            'status': 'Submitted',
-            'timestamp': '2024-01-15T14:30:00Z',
-            'fills': []
-        }
+        order_info = make_tracked_order(
+            12345,
+            exchange='SMART',
+            currency='USD',
+            timestamp='2024-01-15T14:30:00Z',
+            fills=[]
+        )
         
         formatted = order_manager._format_order_info(order_info)
         
@@ -649,58 +583,24 @@ class TestOrderManagerUtilities:
 class TestOrderValidation:
     """Test order parameter validation."""
     
-    @pytest.mark.asyncio
-    async def test_invalid_symbol(self, order_manager):
-        """Test validation with invalid symbol."""
-        result = await order_manager.place_market_order(
-            symbol="",  # Empty symbol
-            action="BUY",
-            quantity=100
-        )
-        
-        assert result['success'] == False
-        assert 'error' in result
-    
-    @pytest.mark.asyncio
-    async def test_invalid_action(self, order_manager):
-        """Test validation with invalid action."""
-        result = await order_manager.place_market_order(
-            symbol="AAPL",
-            action="INVALID",
-            quantity=100
-        )
-        
-        assert result['success'] == False
-        assert 'error' in result
-    
-    @pytest.mark.asyncio 
-    async def test_zero_quantity(self, order_manager):
-        """Test validation with zero quantity."""
-        result = await order_manager.place_market_order(
-            symbol="AAPL",
-            action="BUY",
-            quantity=0
-        )
-        
-        assert result['success'] == False
-        assert 'error' in result
-    
-    @pytest.mark.asyncio
-    async def test_negative_price(self, order_manager):
-        """Test validation with negative price."""
-        result = await order_manager.place_limit_order(
-            symbol="AAPL",
-            action="BUY", 
-            quantity=100,
-            price=-150.0  # Negative price
-        )
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("method,kwargs", [
+        ("place_market_order", {"symbol": "", "action": "BUY", "quantity": 100}),
+        ("place_market_order", {"symbol": "AAPL", "action": "INVALID", "quantity": 100}),
+        ("place_market_order", {"symbol": "AAPL", "action": "BUY", "quantity": 0}),
+        ("place_market_order", {"symbol": "AAPL", "action": "BUY", "quantity": -100}),
+        ("place_limit_order", {"symbol": "AAPL", "action": "BUY", "quantity": 100, "price": -150.0}),
+    ], ids=["empty_symbol", "bad_action", "zero_qty", "neg_qty", "neg_price"])
+    async def test_invalid_params(self, order_manager, method, kwargs):
+        """Test validation rejects invalid order parameters."""
+        result = await getattr(order_manager, method)(**kwargs)
         
         assert result['success'] == False
-        assert 'error' in result
+        _assert_keys(result, {"success", "error"})
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_order_manager_complex_scenarios(enabled_trading_settings):
     """Test complex multi-order scenarios and interactions"""
     # Setup comprehensive test environment
@@ -725,23 +625,15 @@ async def test_order_manager_complex_scenarios(enabled_trading_settings):
     mock_contract.minSize = None
     mock_contract.multiplier = 1
     
-    # Fix: Make qualifyContractsAsync return an awaitable (AsyncMock)
-    async def mock_qualify_contracts_async(contract):
-        return [mock_contract]
-    
-    mock_ib.qualifyContractsAsync = AsyncMock(side_effect=mock_qualify_contracts_async)
+    mock_ib.qualifyContractsAsync = _async_return([mock_contract])
     
     # Setup order tracking
     placed_orders = []
-    order_id_counter = 10001
+    next_order_id = itertools.count(10001)
     
     def mock_place_order(contract, order):
-        nonlocal order_id_counter
-        order.orderId = order_id_counter
-        order_id_counter += 1
-        mock_trade = Mock()
-        mock_trade.order = order
-        mock_trade.contract = contract
+        order.orderId = next(next_order_id)
+        mock_trade = _Trade(order=order, contract=contract)
         placed_orders.append({
             'order_id': order.orderId,
             'symbol': contract.symbol,
@@ -753,48 +645,29 @@ async def test_order_manager_complex_scenarios(enabled_trading_settings):
     
     mock_ib.placeOrder.side_effect = mock_place_order
     
-    # Test complex scenario: Multiple related orders
-    with patch('ib_async.MarketOrder') as mock_market_order, \
-         patch('ib_async.LimitOrder') as mock_limit_order:
-        
-        # Configure order mocks
-        mock_market_order.side_effect = lambda action, quantity: Mock(
-            action=action, 
-            totalQuantity=quantity, 
-            orderType='MKT', 
-            orderId=None
-        )
-        mock_limit_order.side_effect = lambda action, quantity, price: Mock(
-            action=action, 
-            totalQuantity=quantity, 
-            lmtPrice=price,
-            orderType='LMT', 
-            orderId=None
-        )
-        
-        # Scenario 1: Place initial market order
-        result1 = await order_manager.place_market_order(
+    # Test complex scenario: Multiple related orders (real ib_async order objects)
+    # Scenarios 1-3: initial market order, a limit follow-up, and a GTC limit
+    # order, placed concurrently; tasks reach placeOrder in submission order
+    result1, result2, result3 = await asyncio.gather(
+        order_manager.place_market_order(
             symbol="AAPL",
             action="BUY",
             quantity=100
-        )
-        
-        # Scenario 2: Place limit order as follow-up
-        result2 = await order_manager.place_limit_order(
+        ),
+        order_manager.place_limit_order(
             symbol="AAPL", 
             action="SELL",
             quantity=50,
             price=185.0
-        )
-        
-        # Scenario 3: Place another limit order with different parameters
-        result3 = await order_manager.place_limit_order(
+        ),
+        order_manager.place_limit_order(
             symbol="AAPL",
             action="SELL", 
             quantity=25,
             price=190.0,
             time_in_force="GTC"
         )
+    )
     
     # Verify all orders were successful
     assert result1['success'] == True
@@ -16,7 +16,6 @@ class TestResolveSymbolEdgeCases:
     @pytest.mark.asyncio
     async def test_resolve_symbol_case_sensitivity_fuzzy_search(self, mock_ib):
         """Test fuzzy search with lowercase company names"""
-        mock_ib.isConnected.return_value = True
         intl_manager = InternationalManager(mock_ib)
         
         # Mock fuzzy search to simulate case sensitivity issues
@@ -34,7 +33,6 @@ class TestResolveSymbolEdgeCases:
     @pytest.mark.asyncio
     async def test_resolve_symbol_pattern_detection(self, mock_ib):
         """Test symbol pattern detection methods"""
-        mock_ib.isConnected.return_value = True
         intl_manager = InternationalManager(mock_ib)
         
         # Test _is_exact_symbol detection
@@ -60,7 +58,6 @@ class TestResolveSymbolEdgeCases:
     @pytest.mark.asyncio
     async def test_resolve_symbol_confidence_calculation(self, mock_ib):
         """Test confidence score calculation with various scenarios"""
-        mock_ib.isConnected.return_value = True
         intl_manager = InternationalManager(mock_ib)
         
         # Test confidence scoring for exact match
@@ -93,7 +90,6 @@ class TestResolveSymbolEdgeCases:
     @pytest.mark.asyncio
     async def test_resolve_symbol_japanese_symbols(self, mock_ib):
         """Test Japanese symbol handling"""
-        mock_ib.isConnected.return_value = True
         intl_manager = InternationalManager(mock_ib)
         
         # Mock exact symbol resolution for Japanese symbols
@@ -109,7 +105,6 @@ class TestResolveSymbolEdgeCases:
     @pytest.mark.asyncio
     async def test_resolve_symbol_international_explicit_exchange(self, mock_ib):
         """Test international symbols with explicit exchange specification"""
-        mock_ib.isConnected.return_value = True
         intl_manager = InternationalManager(mock_ib)
         
         # Mock successful resolution
@@ -135,7 +130,6 @@ class TestResolveSymbolEdgeCases:
     @pytest.mark.asyncio
     async def test_resolve_symbol_class_shares(self, mock_ib):
         """Test resolution of class shares (BRK.A, BRK.B)"""
-        mock_ib.isConnected.return_value = True
         intl_manager = InternationalManager(mock_ib)
         
         # Mock resolution attempt for class shares
@@ -156,7 +150,6 @@ class TestResolveSymbolEdgeCases:
     @pytest.mark.asyncio
     async def test_resolve_symbol_isin_ambiguity_handling(self, mock_ib):
         """Test ISIN resolution with multiple possible matches"""
-        mock_ib.isConnected.return_value = True
         intl_manager = InternationalManager(mock_ib)
         
         # Mock alternative ID resolution that returns multiple matches
@@ -191,7 +184,6 @@ class TestResolveSymbolEdgeCases:
     @pytest.mark.asyncio 
     async def test_resolve_symbol_cache_key_generation(self, mock_ib):
         """Test cache key generation with different parameters"""
-        mock_ib.isConnected.return_value = True
         intl_manager = InternationalManager(mock_ib)
         
         # Mock to avoid actual API calls
@@ -210,7 +202,6 @@ class TestResolveSymbolEdgeCases:
     @pytest.mark.asyncio
     async def test_resolve_symbol_backwards_compatibility(self, mock_ib):
         """Test backwards compatibility fields in response"""
-        mock_ib.isConnected.return_value = True
         intl_manager = InternationalManager(mock_ib)
         
         # Mock successful resolution